@@ -12,10 +12,14 @@ Usage:
 """
 
 import argparse
-import json
 import sys
 from pathlib import Path
 
+try:  # orjson is faster and accepts bytes directly; stdlib json works too
+    import orjson as _json
+except ImportError:
+    import json as _json
+
 # Add the SDK to the path
 sdk_path = Path(__file__).parent.parent.parent / "packages" / "python" / "src"
 sys.path.insert(0, str(sdk_path))
@@ -33,8 +37,8 @@ from constellation_sdk import (
 
 def load_config(config_path: str) -> dict:
     """Load configuration from JSON file."""
-    with open(config_path) as f:
-        return json.load(f)
+    with open(config_path, "rb") as f:
+        return _json.loads(f.read())
 
 
 def generate_keypair_command():
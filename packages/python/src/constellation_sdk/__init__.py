@@ -2,94 +2,204 @@
 Constellation Metagraph SDK.
 
 Python SDK for standard operations on Constellation Network metagraphs built using the metakit framework.
+
+Submodules are imported lazily (PEP 562): the first access to a name
+triggers the import of the module that defines it. Short-lived CLI
+invocations that only touch one corner of the SDK no longer pay the
+import cost of the crypto and network stacks at startup.
 """
 
+import importlib
+import sys
 from importlib.metadata import PackageNotFoundError, version
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, List
 
 try:
     __version__ = version("constellation-metagraph-sdk")
 except PackageNotFoundError:
     __version__ = "0.0.0-dev"  # Fallback for development
 
-# Binary encoding
-from .binary import encode_data_update, to_bytes
-
-# Canonicalization
-from .canonicalize import canonicalize, canonicalize_bytes
-
-# Codec utilities
-from .codec import decode_data_update
-
-# Currency transaction operations
-from .currency_transaction import (
-    create_currency_transaction,
-    create_currency_transaction_batch,
-    encode_currency_transaction,
-    get_transaction_reference,
-    hash_currency_transaction,
-    is_valid_dag_address,
-    sign_currency_transaction,
-    token_to_units,
-    units_to_token,
-    verify_currency_transaction,
-)
-
-# Currency transaction types
-from .currency_types import (
-    TOKEN_DECIMALS,
-    CurrencyTransaction,
-    CurrencyTransactionValue,
-    TransactionReference,
-    TransferParams,
-)
-
-# Hashing
-from .hash import compute_digest, hash_bytes, hash_data
-
-# Network operations
-from .network import (
-    CurrencyL1Client,
-    DataL1Client,
-    EstimateFeeResponse,
-    NetworkConfig,
-    NetworkError,
-    PendingTransaction,
-    PostDataResponse,
-    PostTransactionResponse,
-    RequestOptions,
-    TransactionStatus,
-)
-
-# Signing
-from .sign import sign, sign_data_update, sign_hash
-
-# High-level API
-from .signed_object import add_signature, batch_sign, create_signed_object
-
-# Core types
-from .types import (
-    ALGORITHM,
-    CONSTELLATION_PREFIX,
-    Hash,
-    KeyPair,
-    SignatureProof,
-    Signed,
-    VerificationResult,
-)
-
-# Verification
-from .verify import verify, verify_hash, verify_signature
-
-# Wallet utilities
-from .wallet import (
-    generate_key_pair,
-    get_address,
-    get_public_key_hex,
-    get_public_key_id,
-    is_valid_private_key,
-    is_valid_public_key,
-    key_pair_from_private_key,
-)
+# Name -> defining submodule, used by the lazy __getattr__ below
+_LAZY_IMPORTS = {
+    name: module
+    for module, names in {
+        ".binary": ["encode_data_update", "to_bytes"],
+        ".canonicalize": ["canonicalize", "canonicalize_bytes", "canonicalize_into"],
+        ".codec": ["decode_data_update"],
+        ".currency_transaction": [
+            "clear_verification_cache",
+            "create_currency_transaction",
+            "create_currency_transaction_batch",
+            "encode_currency_transaction",
+            "get_transaction_reference",
+            "hash_currency_transaction",
+            "hash_currency_transaction_batch",
+            "is_valid_dag_address",
+            "sign_currency_transaction",
+            "token_to_units",
+            "units_to_token",
+            "verify_currency_transaction",
+            "verify_currency_transactions_bulk",
+        ],
+        ".currency_types": [
+            "TOKEN_DECIMALS",
+            "CurrencyTransaction",
+            "CurrencyTransactionValue",
+            "TransactionReference",
+            "TransferParams",
+        ],
+        ".hash": ["compute_digest", "hash_bytes", "hash_data", "hash_data_streaming", "hash_many"],
+        ".network": [
+            "CurrencyL1Client",
+            "DataL1Client",
+            "EstimateFeeResponse",
+            "NetworkConfig",
+            "NetworkError",
+            "PendingTransaction",
+            "PostDataResponse",
+            "PostTransactionResponse",
+            "RequestOptions",
+            "TransactionStatus",
+        ],
+        ".sign": ["sign", "sign_data_update", "sign_hash"],
+        ".signed_object": ["add_signature", "batch_sign", "create_signed_object"],
+        ".types": [
+            "ALGORITHM",
+            "CONSTELLATION_PREFIX",
+            "Hash",
+            "KeyPair",
+            "SignatureProof",
+            "Signed",
+            "VerificationResult",
+        ],
+        ".verify": [
+            "ValidatorRegistry",
+            "verify",
+            "verify_batch",
+            "verify_hash",
+            "verify_many_proofs",
+            "verify_signature",
+        ],
+        ".wallet": [
+            "clear_key_cache",
+            "generate_key_pair",
+            "get_address",
+            "get_public_key_hex",
+            "get_public_key_id",
+            "is_valid_private_key",
+            "is_valid_public_key",
+            "key_pair_from_private_key",
+        ],
+    }.items()
+    for name in names
+}
+
+if TYPE_CHECKING:
+    # Static imports for type checkers; at runtime these go through
+    # the lazy __getattr__ instead
+    from .binary import encode_data_update, to_bytes
+    from .canonicalize import canonicalize, canonicalize_bytes, canonicalize_into
+    from .codec import decode_data_update
+    from .currency_transaction import (
+        clear_verification_cache,
+        create_currency_transaction,
+        create_currency_transaction_batch,
+        encode_currency_transaction,
+        get_transaction_reference,
+        hash_currency_transaction,
+        hash_currency_transaction_batch,
+        is_valid_dag_address,
+        sign_currency_transaction,
+        token_to_units,
+        units_to_token,
+        verify_currency_transaction,
+        verify_currency_transactions_bulk,
+    )
+    from .currency_types import (
+        TOKEN_DECIMALS,
+        CurrencyTransaction,
+        CurrencyTransactionValue,
+        TransactionReference,
+        TransferParams,
+    )
+    from .hash import compute_digest, hash_bytes, hash_data, hash_data_streaming, hash_many
+    from .network import (
+        CurrencyL1Client,
+        DataL1Client,
+        EstimateFeeResponse,
+        NetworkConfig,
+        NetworkError,
+        PendingTransaction,
+        PostDataResponse,
+        PostTransactionResponse,
+        RequestOptions,
+        TransactionStatus,
+    )
+    from .sign import sign, sign_data_update, sign_hash
+    from .signed_object import add_signature, batch_sign, create_signed_object
+    from .types import (
+        ALGORITHM,
+        CONSTELLATION_PREFIX,
+        Hash,
+        KeyPair,
+        SignatureProof,
+        Signed,
+        VerificationResult,
+    )
+    from .verify import (
+        ValidatorRegistry,
+        verify,
+        verify_batch,
+        verify_hash,
+        verify_many_proofs,
+        verify_signature,
+    )
+    from .wallet import (
+        clear_key_cache,
+        generate_key_pair,
+        get_address,
+        get_public_key_hex,
+        get_public_key_id,
+        is_valid_private_key,
+        is_valid_public_key,
+        key_pair_from_private_key,
+    )
+
+
+# Public functions that share their name with the submodule defining them.
+# Importing such a submodule binds the module object onto the package,
+# which would otherwise shadow the function.
+_SHADOWED = frozenset({"canonicalize", "sign", "verify"})
+
+
+class _LazyPackage(ModuleType):
+    """Package module that resolves public names lazily (PEP 562)."""
+
+    def __getattribute__(self, name: str) -> Any:
+        value = ModuleType.__getattribute__(self, name)
+        if name in _SHADOWED and isinstance(value, ModuleType):
+            # Unwrap the function from its same-named submodule
+            value = ModuleType.__getattribute__(value, name)
+        return value
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            module_name = _LAZY_IMPORTS[name]
+        except KeyError:
+            raise AttributeError(f"module {self.__name__!r} has no attribute {name!r}") from None
+        value = getattr(importlib.import_module(module_name, self.__name__), name)
+        if name not in _SHADOWED:
+            # Cache on the package so subsequent lookups bypass __getattr__
+            setattr(self, name, value)
+        return value
+
+    def __dir__(self) -> List[str]:
+        return sorted(set(__all__) | set(vars(self)))
+
+
+sys.modules[__name__].__class__ = _LazyPackage
+
 
 __all__ = [
     # Version
@@ -106,12 +216,15 @@ __all__ = [
     # Canonicalization
     "canonicalize",
     "canonicalize_bytes",
+    "canonicalize_into",
     # Binary
     "to_bytes",
     "encode_data_update",
     # Hash
     "hash_data",
+    "hash_data_streaming",
     "hash_bytes",
+    "hash_many",
     "compute_digest",
     # Codec
     "decode_data_update",
@@ -123,12 +236,16 @@ __all__ = [
     "verify",
     "verify_hash",
     "verify_signature",
+    "verify_batch",
+    "verify_many_proofs",
+    "ValidatorRegistry",
     # High-level
     "create_signed_object",
     "add_signature",
     "batch_sign",
     # Wallet
     "generate_key_pair",
+    "clear_key_cache",
     "key_pair_from_private_key",
     "get_public_key_hex",
     "get_public_key_id",
@@ -146,8 +263,11 @@ __all__ = [
     "create_currency_transaction_batch",
     "sign_currency_transaction",
     "verify_currency_transaction",
+    "verify_currency_transactions_bulk",
+    "clear_verification_cache",
     "encode_currency_transaction",
     "hash_currency_transaction",
+    "hash_currency_transaction_batch",
     "get_transaction_reference",
     "is_valid_dag_address",
     "token_to_units",
@@ -0,0 +1,210 @@
+"""
+ECDSA backend selection for secp256k1 operations.
+
+When the optional `coincurve` package (libsecp256k1 bindings) is
+installed, signing and verification dispatch to optimized C code that
+uses precomputed tables and the curve endomorphism. Otherwise the
+pure-Python `ecdsa` package is used. Both produce and accept the same
+DER-encoded signatures, so the choice is transparent to callers.
+"""
+
+import binascii
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
+
+from ecdsa import SECP256k1, SigningKey, VerifyingKey
+from ecdsa.util import sigdecode_der, sigdecode_string, sigencode_der
+
+try:
+    import coincurve
+    from coincurve.ecdsa import cdata_to_der, der_to_cdata, deserialize_compact, signature_normalize
+
+    _HAVE_COINCURVE = True
+except ImportError:
+    _HAVE_COINCURVE = False
+
+BACKEND = "coincurve" if _HAVE_COINCURVE else "ecdsa"
+"""Name of the active ECDSA backend ("coincurve" or "ecdsa")."""
+
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """
+    Return the shared verification pool, creating it on first use.
+
+    Threading ECDSA only pays off on the coincurve backend, which
+    releases the GIL inside libsecp256k1 — callers gate on `BACKEND`
+    before fanning out, then share this pool instead of paying
+    ThreadPoolExecutor startup per call.
+    """
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        _EXECUTOR = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+    return _EXECUTOR
+
+
+@functools.lru_cache(maxsize=256)
+def _load_private_key(private_key: str) -> Any:
+    """
+    Parse a hex private key into the active backend's key object.
+
+    Construction validates the scalar and precomputes internal state, so
+    results are memoized in a bounded LRU keyed by the hex string. Cached
+    key objects hold key material for the life of the process (or until
+    `clear_key_cache`), which is no longer than the hex strings callers
+    already keep around.
+    """
+    key_bytes = binascii.a2b_hex(private_key)
+    if _HAVE_COINCURVE:
+        return coincurve.PrivateKey(key_bytes)
+    return SigningKey.from_string(key_bytes, curve=SECP256k1)
+
+
+@functools.lru_cache(maxsize=1024)
+def _load_public_key(public_key: str) -> Any:
+    """
+    Parse a hex public key into the active backend's key object.
+
+    Parsing validates that the point is on-curve, which is the expensive
+    part of pure-Python verification setup, so results are memoized —
+    verifying many proofs from the same signer (sequential transactions
+    from one wallet) then reuses the validated key object.
+    """
+    pk_bytes = binascii.a2b_hex(public_key)
+    if len(pk_bytes) == 64:
+        pk_bytes = b"\x04" + pk_bytes
+    if _HAVE_COINCURVE:
+        return coincurve.PublicKey(pk_bytes)
+    # Pass the full encoding: ecdsa validates the point-format prefix
+    # (rejecting e.g. 0x05) and handles compressed keys, matching what
+    # coincurve accepts
+    return VerifyingKey.from_string(pk_bytes, curve=SECP256k1)
+
+
+def clear_key_cache() -> None:
+    """Drop all cached key objects and derived public keys."""
+    _load_private_key.cache_clear()
+    _load_public_key.cache_clear()
+    public_key_from_private.cache_clear()
+
+
+def sign_digest(private_key: str, digest: bytes) -> str:
+    """
+    Sign a 32-byte digest with a secp256k1 private key.
+
+    Args:
+        private_key: Private key in hex format (64 characters)
+        digest: 32-byte digest to sign
+
+    Returns:
+        DER-encoded signature in hex format
+    """
+    key = _load_private_key(private_key)
+    if _HAVE_COINCURVE:
+        signature: bytes = key.sign(digest, hasher=None)
+        return signature.hex()
+    der_signature: bytes = key.sign_digest(digest, sigencode=sigencode_der)
+    return der_signature.hex()
+
+
+def verify_digest(public_key: str, signature: str, digest: bytes) -> bool:
+    """
+    Verify a signature over a 32-byte digest.
+
+    Accepts DER-encoded signatures (the wire format) as well as 64-byte
+    compact r||s signatures, which skip ASN.1 parsing entirely.
+
+    Args:
+        public_key: Public key in hex format (with or without 04 prefix)
+        signature: DER or compact signature in hex format
+        digest: 32-byte digest that was signed
+
+    Returns:
+        True if the signature is valid
+    """
+    try:
+        key = _load_public_key(public_key)
+    except Exception:
+        return False
+    return verify_digest_with_key(key, signature, digest)
+
+
+def verify_digest_with_key(key: Any, signature: str, digest: bytes) -> bool:
+    """
+    Verify a signature over a 32-byte digest with an already-parsed key.
+
+    Variant of `verify_digest` for callers that manage their own key
+    objects (e.g. a validator registry) instead of going through the
+    module-level LRU.
+
+    Args:
+        key: Key object returned by `_load_public_key`
+        signature: DER or compact signature in hex format
+        digest: 32-byte digest that was signed
+
+    Returns:
+        True if the signature is valid
+    """
+    try:
+        sig_bytes = binascii.a2b_hex(signature)
+
+        if _HAVE_COINCURVE:
+            # Compact parse is a memcpy; DER goes through the ASN.1 parser.
+            # libsecp256k1 rejects high-S signatures, so normalize to low-S
+            # either way so externally produced signatures verify.
+            if len(sig_bytes) == 64:
+                cdata = deserialize_compact(sig_bytes)
+            else:
+                cdata = der_to_cdata(sig_bytes)
+            sig_der = cdata_to_der(signature_normalize(cdata)[1])
+            return bool(key.verify(sig_der, digest, hasher=None))
+
+        sigdecode = sigdecode_string if len(sig_bytes) == 64 else sigdecode_der
+        result: bool = key.verify_digest(sig_bytes, digest, sigdecode=sigdecode)
+        return result
+    except Exception:
+        return False
+
+
+@functools.lru_cache(maxsize=256)
+def public_key_from_private(private_key: str, compressed: bool = False) -> str:
+    """
+    Derive the public key from a private key.
+
+    Derivation costs a scalar multiplication, and signing paths need the
+    public key (for proof IDs) on every call, so results are memoized
+    alongside the key-object cache.
+
+    Args:
+        private_key: Private key in hex format (64 characters)
+        compressed: If True, return the 33-byte compressed encoding
+
+    Returns:
+        Public key hex (130 characters 04-prefixed, or 66 compressed)
+    """
+    key = _load_private_key(private_key)
+    if _HAVE_COINCURVE:
+        pk: bytes = key.public_key.format(compressed=compressed)
+        return pk.hex()
+    vk = key.verifying_key
+    if compressed:
+        raw: bytes = vk.to_string("compressed")
+        return raw.hex()
+    uncompressed: bytes = vk.to_string()
+    return "04" + uncompressed.hex()
+
+
+def generate_private_key() -> str:
+    """
+    Generate a new random secp256k1 private key.
+
+    Returns:
+        Private key in hex format (64 characters)
+    """
+    if _HAVE_COINCURVE:
+        return coincurve.PrivateKey().to_hex()
+    key_bytes: bytes = SigningKey.generate(curve=SECP256k1).to_string()
+    return key_bytes.hex()
@@ -5,12 +5,18 @@ Converts JSON data to binary format for cryptographic operations.
 Supports both regular encoding and DataUpdate encoding with Constellation prefix.
 """
 
-import base64
 from typing import Any
 
-from .canonicalize import canonicalize
+try:  # pybase64 uses SSSE3/AVX2 shuffles, ~5-10x stdlib throughput
+    from pybase64 import b64encode as _b64encode
+except ImportError:
+    from base64 import b64encode as _b64encode
+
+from .canonicalize import canonicalize_bytes
 from .types import CONSTELLATION_PREFIX
 
+_PREFIX_BYTES = CONSTELLATION_PREFIX.encode("utf-8")
+
 
 def to_bytes(data: Any, is_data_update: bool = False) -> bytes:
     """
@@ -38,15 +44,16 @@ def to_bytes(data: Any, is_data_update: bool = False) -> bytes:
         >>> to_bytes({"action": "test"}, is_data_update=True)
         b'\\x19Constellation Signed Data:\\n...'
     """
-    canonical_json = canonicalize(data)
-    utf8_bytes = canonical_json.encode("utf-8")
+    # Canonical JSON is already UTF-8 bytes; no str round-trip needed
+    utf8_bytes = canonicalize_bytes(data)
 
     if is_data_update:
-        # Base64 encode the UTF-8 bytes
-        base64_string = base64.b64encode(utf8_bytes).decode("ascii")
-        # Create the wrapped string with Constellation prefix
-        wrapped_string = f"{CONSTELLATION_PREFIX}{len(base64_string)}\n{base64_string}"
-        return wrapped_string.encode("utf-8")
+        # Base64 encode the UTF-8 bytes and wrap with the Constellation
+        # prefix, assembled directly in bytes (no intermediate str)
+        base64_bytes = _b64encode(utf8_bytes)
+        return b"".join(
+            (_PREFIX_BYTES, str(len(base64_bytes)).encode("ascii"), b"\n", base64_bytes)
+        )
 
     return utf8_bytes
 
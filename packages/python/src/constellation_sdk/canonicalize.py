@@ -3,12 +3,61 @@ RFC 8785 JSON Canonicalization.
 
 Provides deterministic JSON serialization according to RFC 8785.
 This ensures identical JSON objects always produce identical strings.
+
+`canonicalize_bytes` is the primary entry point: it returns UTF-8 bytes
+directly, which is what every downstream consumer (binary encoding,
+hashing, signing) actually needs. When the optional compiled backend
+`_canonicalize_native` is present (a pyo3/serde_jcs extension), it is
+used transparently; otherwise the pure-Python `rfc8785` package is used.
 """
 
-from typing import Any
+from typing import Any, Callable
 
 import rfc8785
 
+_dumps: Callable[[Any], bytes]
+try:  # Optional compiled canonicalizer (not shipped with the pure-Python SDK)
+    from . import _canonicalize_native  # type: ignore[attr-defined]
+
+    _dumps = _canonicalize_native.dumps
+except ImportError:
+    _dumps = rfc8785.dumps
+
+
+def canonicalize_bytes(data: Any) -> bytes:
+    """
+    Canonicalize JSON data and return as UTF-8 bytes.
+
+    This is the primary canonicalization API: signing and hashing operate
+    on bytes, so using this avoids a decode/encode round-trip.
+
+    Args:
+        data: Any JSON-serializable object
+
+    Returns:
+        Canonical JSON as UTF-8 encoded bytes
+    """
+    return _dumps(data)
+
+
+def canonicalize_into(data: Any, sink: Any) -> None:
+    """
+    Stream canonical JSON UTF-8 bytes into a writable binary sink.
+
+    Avoids materializing the full canonical output for large payloads;
+    the sink's ``write`` method is called with chunks as they are
+    produced.
+
+    Args:
+        data: Any JSON-serializable object
+        sink: File-like object with a ``write(bytes)`` method
+    """
+    if _dumps is rfc8785.dumps:
+        rfc8785.dump(data, sink)
+    else:
+        # The native backend has no streaming entry point; emit in one write
+        sink.write(_dumps(data))
+
 
 def canonicalize(data: Any) -> str:
     """
@@ -30,18 +79,4 @@ def canonicalize(data: Any) -> str:
         >>> canonicalize({"b": 2, "a": 1})
         '{"a":1,"b":2}'
     """
-    # rfc8785.dumps returns bytes, decode to string
-    return rfc8785.dumps(data).decode("utf-8")
-
-
-def canonicalize_bytes(data: Any) -> bytes:
-    """
-    Canonicalize JSON data and return as UTF-8 bytes.
-
-    Args:
-        data: Any JSON-serializable object
-
-    Returns:
-        Canonical JSON as UTF-8 encoded bytes
-    """
-    return rfc8785.dumps(data)
+    return canonicalize_bytes(data).decode("utf-8")
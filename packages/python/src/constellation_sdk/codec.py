@@ -5,9 +5,13 @@ Encoding/decoding utilities for the Constellation signature protocol.
 """
 
 import base64
-import json
 from typing import Any, TypeVar
 
+try:  # orjson parses 3-6x faster and accepts bytes directly
+    import orjson as _json
+except ImportError:
+    import json as _json  # type: ignore[no-redef]
+
 from .binary import encode_data_update, to_bytes
 from .types import CONSTELLATION_PREFIX
 
@@ -16,6 +20,8 @@ T = TypeVar("T")
 # Re-export from binary
 __all__ = ["to_bytes", "encode_data_update", "decode_data_update", "CONSTELLATION_PREFIX"]
 
+_PREFIX_BYTES = CONSTELLATION_PREFIX.encode("utf-8")
+
 
 def decode_data_update(data: bytes) -> Any:
     """
@@ -30,24 +36,19 @@ def decode_data_update(data: bytes) -> Any:
     Raises:
         ValueError: If bytes are not valid DataUpdate encoding
     """
-    text = data.decode("utf-8")
-
-    # Validate prefix
-    if not text.startswith(CONSTELLATION_PREFIX):
+    # Validate prefix (structural bytes are ASCII; no need to decode the
+    # whole buffer to str just to parse them)
+    if not data.startswith(_PREFIX_BYTES):
         raise ValueError("Invalid DataUpdate encoding: missing Constellation prefix")
 
     # Parse the format: \x19Constellation Signed Data:\n{length}\n{base64}
-    without_prefix = text[len(CONSTELLATION_PREFIX) :]
-    newline_index = without_prefix.find("\n")
+    length_bytes, sep, base64_data = data[len(_PREFIX_BYTES) :].partition(b"\n")
 
-    if newline_index == -1:
+    if not sep:
         raise ValueError("Invalid DataUpdate encoding: missing length delimiter")
 
-    length_str = without_prefix[:newline_index]
-    base64_data = without_prefix[newline_index + 1 :]
-
     try:
-        expected_length = int(length_str)
+        expected_length = int(length_bytes)
     except ValueError:
         raise ValueError("Invalid DataUpdate encoding: invalid length")
 
@@ -56,6 +57,5 @@ def decode_data_update(data: bytes) -> Any:
 
     # Decode base64 to UTF-8 JSON
     json_bytes = base64.b64decode(base64_data)
-    json_string = json_bytes.decode("utf-8")
 
-    return json.loads(json_string)
+    return _json.loads(json_bytes)
@@ -4,15 +4,14 @@ Currency transaction operations for metagraph token transfers.
 Functions for creating, signing, and verifying metagraph token transactions (v2 format).
 """
 
+import decimal
+import functools
 import hashlib
-import math
 import os
-import re
-from typing import List
-
-from ecdsa import SECP256k1, SigningKey, VerifyingKey
-from ecdsa.util import sigdecode_der, sigencode_der
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Union
 
+from . import _backend
 from .currency_types import (
     TOKEN_DECIMALS,
     CurrencyTransaction,
@@ -26,22 +25,37 @@ from .wallet import get_address
 # Minimum salt complexity (from dag4.js)
 MIN_SALT = 2**53 - 2**48  # Number.MAX_SAFE_INTEGER - 2^48
 
+# Base58 alphabet of a DAG address body (no 0, O, I, l)
+_BASE58_BYTES = b"123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+
 
-def token_to_units(amount: float) -> int:
+def token_to_units(amount: Union[int, float, str, decimal.Decimal]) -> int:
     """
     Convert token amount to smallest units.
 
+    Accepts int, float, str, and Decimal amounts. Floats go through
+    their shortest decimal representation, so amounts like 0.1 land on
+    exactly 10000000 units instead of picking up float rounding error
+    from `amount * 1e8`; str and Decimal inputs never touch binary
+    floating point at all, which is the preferred form for amounts
+    carried as text (API payloads, config).
+
     Args:
-        amount: Amount in token units (e.g., 100.5)
+        amount: Amount in token units (e.g., 100.5, "100.5")
 
     Returns:
         Amount in smallest units (1e-8)
 
     Example:
-        >>> units = token_to_units(100.5)
+        >>> units = token_to_units("100.5")
         >>> print(units)  # 10050000000
     """
-    return math.floor(amount * 1e8)
+    if isinstance(amount, int):
+        return amount * 100_000_000
+    if isinstance(amount, float):
+        amount = str(amount)
+    scaled = decimal.Decimal(amount).scaleb(8)
+    return int(scaled.to_integral_value(rounding=decimal.ROUND_FLOOR))
 
 
 def units_to_token(units: int) -> float:
@@ -75,19 +89,22 @@ def is_valid_dag_address(address: str) -> bool:
         >>> valid = is_valid_dag_address('DAG...')
     """
     # DAG addresses: DAG + parity digit (0-8) + 36 base58 chars = 40 chars total
-    if not address.startswith("DAG"):
-        return False
     # Exact length check
     if len(address) != 40:
         return False
+    if not address.startswith("DAG"):
+        return False
     # Position 3 (after DAG) must be parity digit 0-8
     if not address[3].isdigit() or int(address[3]) > 8:
         return False
-    # Remaining 36 characters must be base58 (no 0, O, I, l)
-    base58_pattern = re.compile(
-        r"^[123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz]{36}$"
-    )
-    return bool(base58_pattern.match(address[4:]))
+    # Remaining 36 characters must be base58 (no 0, O, I, l). Deleting
+    # the alphabet via bytes.translate is a single C-level scan; anything
+    # left over is an invalid character.
+    try:
+        tail = address[4:].encode("ascii")
+    except UnicodeEncodeError:
+        return False
+    return not tail.translate(None, delete=_BASE58_BYTES)
 
 
 def _generate_salt() -> str:
@@ -99,6 +116,17 @@ def _generate_salt() -> str:
     return str(salt)
 
 
+def _generate_salts(n: int) -> List[str]:
+    """
+    Generate ``n`` random salts from a single entropy read.
+
+    os.urandom is a syscall; batch paths fetch all 6*n bytes at once and
+    slice, instead of paying the syscall per transaction.
+    """
+    buf = os.urandom(6 * n)
+    return [str(MIN_SALT + int.from_bytes(buf[i : i + 6], "big")) for i in range(0, 6 * n, 6)]
+
+
 def _encode_transaction(tx: CurrencyTransaction) -> str:
     """
     Encode a currency transaction for hashing.
@@ -111,97 +139,107 @@ def _encode_transaction(tx: CurrencyTransaction) -> str:
     Returns:
         Encoded transaction string
     """
-    parent_count = "2"  # Always 2 parents for v2
-    source = tx.value.source
-    destination = tx.value.destination
-    amount_hex = hex(tx.value.amount)[2:]  # Remove '0x' prefix
-    parent_hash = tx.value.parent.hash
-    ordinal = str(tx.value.parent.ordinal)
-    fee = str(tx.value.fee)
+    value = tx.value
+    source = value.source
+    destination = value.destination
+    amount_hex = format(value.amount, "x")
+    parent_hash = value.parent.hash
+    ordinal = str(value.parent.ordinal)
+    fee = str(value.fee)
 
     # Convert salt to hex (handle negative numbers if needed)
-    salt_int = int(tx.value.salt)
+    salt_int = int(value.salt)
     if salt_int < 0:
-        salt_hex = hex((1 << 64) + salt_int)[2:]
-    else:
-        salt_hex = hex(salt_int)[2:]
-
-    # Build encoded string (length-prefixed format)
-    parts = [
-        parent_count,
-        str(len(source)),
-        source,
-        str(len(destination)),
-        destination,
-        str(len(amount_hex)),
-        amount_hex,
-        str(len(parent_hash)),
-        parent_hash,
-        str(len(ordinal)),
-        ordinal,
-        str(len(fee)),
-        fee,
-        str(len(salt_hex)),
-        salt_hex,
-    ]
-
-    return "".join(parts)
+        salt_int += 1 << 64
+    salt_hex = format(salt_int, "x")
+
+    # Length-prefixed format, leading "2" = parent count (always 2 for v2).
+    # A single f-string builds the result in one pass through CPython's
+    # unicode writer instead of ~20 intermediate strings and a join.
+    return (
+        f"2"
+        f"{len(source)}{source}"
+        f"{len(destination)}{destination}"
+        f"{len(amount_hex)}{amount_hex}"
+        f"{len(parent_hash)}{parent_hash}"
+        f"{len(ordinal)}{ordinal}"
+        f"{len(fee)}{fee}"
+        f"{len(salt_hex)}{salt_hex}"
+    )
 
 
-def _kryo_serialize(msg: str, set_references: bool = True) -> bytes:
+def _utf8_length(value: int) -> bytes:
+    """Encode a kryo UTF-8 length as a variable-length integer."""
+    if value >> 6 == 0:
+        return bytes([value | 0x80])
+    elif value >> 13 == 0:
+        return bytes([value | 0x40 | 0x80, value >> 6])
+    elif value >> 20 == 0:
+        return bytes([value | 0x40 | 0x80, (value >> 6) | 0x80, value >> 13])
+    elif value >> 27 == 0:
+        return bytes(
+            [
+                value | 0x40 | 0x80,
+                (value >> 6) | 0x80,
+                (value >> 13) | 0x80,
+                value >> 20,
+            ]
+        )
+    else:
+        return bytes(
+            [
+                value | 0x40 | 0x80,
+                (value >> 6) | 0x80,
+                (value >> 13) | 0x80,
+                (value >> 20) | 0x80,
+                value >> 27,
+            ]
+        )
+
+
+def _kryo_serialize(msg: bytes, set_references: bool = True) -> bytes:
     """
     Kryo serialization for transaction encoding.
 
     Matches the txEncode.kryoSerialize() method from dag4.js.
 
     Args:
-        msg: Message to serialize
+        msg: UTF-8 encoded message to serialize
         set_references: Whether to set references (True for v1, False for v2)
 
     Returns:
         Serialized bytes
     """
+    length = len(msg) + 1
 
-    # UTF-8 length encoding
-    def utf8_length(value: int) -> bytes:
-        """Encode length as variable-length integer."""
-        if value >> 6 == 0:
-            return bytes([value | 0x80])
-        elif value >> 13 == 0:
-            return bytes([value | 0x40 | 0x80, value >> 6])
-        elif value >> 20 == 0:
-            return bytes([value | 0x40 | 0x80, (value >> 6) | 0x80, value >> 13])
-        elif value >> 27 == 0:
-            return bytes(
-                [
-                    value | 0x40 | 0x80,
-                    (value >> 6) | 0x80,
-                    (value >> 13) | 0x80,
-                    value >> 20,
-                ]
-            )
-        else:
-            return bytes(
-                [
-                    value | 0x40 | 0x80,
-                    (value >> 6) | 0x80,
-                    (value >> 13) | 0x80,
-                    (value >> 20) | 0x80,
-                    value >> 27,
-                ]
-            )
+    # v2 hashing always lands here with set_references=False and an
+    # encoded transaction of a few hundred ASCII chars, so inline the
+    # one- and two-byte varint cases
+    if not set_references:
+        if length >> 6 == 0:
+            return bytes([0x03, length | 0x80]) + msg
+        if length < 256:
+            return bytes([0x03, length | 0x40 | 0x80, length >> 6]) + msg
+        return b"\x03" + _utf8_length(length) + msg
 
-    # Build serialized message
-    prefix_bytes = bytes([0x03])
-    if set_references:
-        prefix_bytes += bytes([0x01])
+    return b"\x03\x01" + _utf8_length(length) + msg
 
-    length = len(msg) + 1
-    prefix_bytes += utf8_length(length)
 
-    msg_bytes = msg.encode("utf-8")
+def _validate_v2_kryo_header(data: bytes) -> bool:
+    """
+    Check that bytes carry the v2 kryo header.
+
+    v2 serialization starts with the 0x03 string-type marker followed
+    directly by the length varint — never the 0x01 reference flag that
+    v1 (set_references=True) inserts. Two byte compares, no parsing.
+
+    Args:
+        data: Serialized bytes to check
 
-    return prefix_bytes + msg_bytes
+    Returns:
+        True if the header matches the v2 format
+    """
+    return len(data) >= 2 and data[0] == 0x03 and data[1] != 0x01
 
 
 def create_currency_transaction(
@@ -231,14 +269,59 @@ def create_currency_transaction(
         ... )
     """
     # Get source address from private key
-    sk = SigningKey.from_string(bytes.fromhex(private_key), curve=SECP256k1)
-    vk = sk.verifying_key
-    public_key = "04" + vk.to_string().hex()
+    public_key = _backend.public_key_from_private(private_key)
     source = get_address(public_key)
 
-    # Validate addresses
     if not is_valid_dag_address(source):
         raise ValueError("Invalid source address")
+
+    # Build and validate the transaction value
+    tx_value = _prepare_transaction_value(source, params, last_ref)
+
+    # Create signed transaction
+    tx = Signed(value=tx_value, proofs=[])
+
+    # Encode and hash
+    hash_hex = hash_currency_transaction(tx).value
+
+    # Sign
+    signature = _sign_hash(hash_hex, private_key)
+
+    # Create proof
+    public_key_id = public_key[2:]  # Remove '04' prefix
+    proof = SignatureProof(id=public_key_id, signature=signature)
+
+    # Add proof to transaction
+    tx.proofs.append(proof)
+
+    return tx
+
+
+def _prepare_transaction_value(
+    source: str,
+    params: TransferParams,
+    last_ref: TransactionReference,
+    salt: Optional[str] = None,
+) -> CurrencyTransactionValue:
+    """
+    Validate transfer parameters and build an unsigned transaction value.
+
+    The source address is taken as already derived/validated so batch
+    callers can hoist that work out of their per-transaction loop, and a
+    pre-generated salt may be passed for the same reason.
+
+    Args:
+        source: Source DAG address (already validated)
+        params: Transfer parameters
+        last_ref: Reference to parent transaction
+        salt: Pre-generated salt, or None to generate one
+
+    Returns:
+        Transaction value ready for signing
+
+    Raises:
+        ValueError: If the destination or amounts are invalid
+    """
     if not is_valid_dag_address(params.destination):
         raise ValueError("Invalid destination address")
     if source == params.destination:
@@ -254,40 +337,15 @@ def create_currency_transaction(
     if fee < 0:
         raise ValueError("Fee must be greater than or equal to zero")
 
-    # Generate salt
-    salt = _generate_salt()
-
-    # Create transaction value
-    tx_value = CurrencyTransactionValue(
+    return CurrencyTransactionValue(
         source=source,
         destination=params.destination,
         amount=amount,
         fee=fee,
         parent=last_ref,
-        salt=salt,
+        salt=salt if salt is not None else _generate_salt(),
     )
 
-    # Create signed transaction
-    tx = Signed(value=tx_value, proofs=[])
-
-    # Encode and hash
-    encoded = _encode_transaction(tx)
-    serialized = _kryo_serialize(encoded, set_references=False)
-    hash_bytes = hashlib.sha256(serialized).digest()
-    hash_hex = hash_bytes.hex()
-
-    # Sign
-    signature = _sign_hash(hash_hex, private_key)
-
-    # Create proof
-    public_key_id = public_key[2:]  # Remove '04' prefix
-    proof = SignatureProof(id=public_key_id, signature=signature)
-
-    # Add proof to transaction
-    tx.proofs.append(proof)
-
-    return tx
-
 
 def create_currency_transaction_batch(
     transfers: List[TransferParams],
@@ -318,19 +376,50 @@ def create_currency_transaction_batch(
         ...     TransactionReference(hash='abc123...', ordinal=5)
         ... )
     """
+    # Source derivation/validation is invariant across the batch
+    public_key = _backend.public_key_from_private(private_key)
+    source = get_address(public_key)
+    if not is_valid_dag_address(source):
+        raise ValueError("Invalid source address")
+    public_key_id = public_key[2:]  # Remove '04' prefix
+
+    # The value chain is built sequentially — each parent reference is the
+    # hash of the previous transaction's value — but the hash covers only
+    # the value, not proofs, so signing is independent per transaction.
+    # On the coincurve backend each sign is submitted to a pool the
+    # moment its hash is known, overlapping sign(i) with encode+hash(i+1)
+    # — libsecp256k1 releases the GIL during the C sign call, so the
+    # workers scale across cores. The pure-Python backend holds the GIL
+    # throughout, so it takes the sequential loop instead.
     transactions: List[CurrencyTransaction] = []
     current_ref = TransactionReference(hash=last_ref.hash, ordinal=last_ref.ordinal)
+    salts = _generate_salts(len(transfers))
+
+    if len(transfers) > 1 and _backend.BACKEND == "coincurve":
+        with ThreadPoolExecutor(max_workers=min(len(transfers), os.cpu_count() or 1)) as executor:
+            futures = []
+            for transfer, salt in zip(transfers, salts):
+                tx_value = _prepare_transaction_value(source, transfer, current_ref, salt)
+                tx: CurrencyTransaction = Signed(value=tx_value, proofs=[])
+                hash_hex = hash_currency_transaction(tx).value
+
+                transactions.append(tx)
+                futures.append(executor.submit(_sign_hash, hash_hex, private_key))
+                current_ref = TransactionReference(hash=hash_hex, ordinal=current_ref.ordinal + 1)
+            signatures = [future.result() for future in futures]
+    else:
+        signatures = []
+        for transfer, salt in zip(transfers, salts):
+            tx_value = _prepare_transaction_value(source, transfer, current_ref, salt)
+            tx = Signed(value=tx_value, proofs=[])
+            hash_hex = hash_currency_transaction(tx).value
 
-    for transfer in transfers:
-        tx = create_currency_transaction(transfer, private_key, current_ref)
-
-        # Calculate hash for next transaction's parent reference
-        hash_result = hash_currency_transaction(tx)
-
-        # Update reference for next transaction
-        current_ref = TransactionReference(hash=hash_result.value, ordinal=current_ref.ordinal + 1)
+            transactions.append(tx)
+            signatures.append(_sign_hash(hash_hex, private_key))
+            current_ref = TransactionReference(hash=hash_hex, ordinal=current_ref.ordinal + 1)
 
-        transactions.append(tx)
+    for tx, signature in zip(transactions, signatures):
+        tx.proofs.append(SignatureProof(id=public_key_id, signature=signature))
 
     return transactions
 
@@ -338,6 +427,7 @@ def create_currency_transaction_batch(
 def sign_currency_transaction(
     transaction: CurrencyTransaction,
     private_key: str,
+    verify: bool = False,
 ) -> CurrencyTransaction:
     """
     Add a signature to an existing currency transaction (for multi-sig).
@@ -345,32 +435,30 @@ def sign_currency_transaction(
     Args:
         transaction: Transaction to sign
         private_key: Private key to sign with
+        verify: If True, verify the fresh signature before returning.
+            Off by default — verify costs about as much as sign, and a
+            correct backend does not silently produce bad signatures.
 
     Returns:
         Transaction with additional signature
 
     Raises:
-        ValueError: If sign-verify fails
+        ValueError: If ``verify`` is set and the sign-verify check fails
 
     Example:
         >>> signed_tx = sign_currency_transaction(tx, private_key2)
     """
-    # Encode and hash
-    encoded = _encode_transaction(transaction)
-    serialized = _kryo_serialize(encoded, set_references=False)
-    hash_bytes = hashlib.sha256(serialized).digest()
-    hash_hex = hash_bytes.hex()
+    # Encode and hash (reuses the hash cached at creation time)
+    hash_hex = hash_currency_transaction(transaction).value
 
     # Sign
     signature = _sign_hash(hash_hex, private_key)
 
     # Get public key
-    sk = SigningKey.from_string(bytes.fromhex(private_key), curve=SECP256k1)
-    vk = sk.verifying_key
-    public_key = "04" + vk.to_string().hex()
+    public_key = _backend.public_key_from_private(private_key)
 
-    # Verify signature
-    if not _verify_hash(public_key, hash_hex, signature):
+    # Optional sign-verify self-check
+    if verify and not _verify_hash(public_key, hash_hex, signature):
         raise ValueError("Sign-Verify failed")
 
     # Create proof
@@ -378,8 +466,11 @@ def sign_currency_transaction(
     proof = SignatureProof(id=public_key_id, signature=signature)
 
     # Add proof (create new signed transaction with updated proofs)
-    new_proofs = [*transaction.proofs, proof]
-    return Signed(value=transaction.value, proofs=new_proofs)
+    signed: CurrencyTransaction = Signed(
+        value=transaction.value, proofs=[*transaction.proofs, proof]
+    )
+    signed._cached_hash = transaction._cached_hash
+    return signed
 
 
 def verify_currency_transaction(transaction: CurrencyTransaction) -> VerificationResult:
@@ -396,20 +487,30 @@ def verify_currency_transaction(transaction: CurrencyTransaction) -> Verificatio
         >>> result = verify_currency_transaction(tx)
         >>> print('Valid:', result.is_valid)
     """
-    # Encode and hash
-    encoded = _encode_transaction(transaction)
-    serialized = _kryo_serialize(encoded, set_references=False)
-    hash_bytes = hashlib.sha256(serialized).digest()
-    hash_hex = hash_bytes.hex()
+    # Encode and hash (reuses the hash cached at creation time), then
+    # prehash once — the signing digest is identical for every proof
+    hash_hex = hash_currency_transaction(transaction).value
+    digest = _prehash(hash_hex)
 
     valid_proofs: List[SignatureProof] = []
     invalid_proofs: List[SignatureProof] = []
 
-    # Verify each proof
-    for proof in transaction.proofs:
-        public_key = "04" + proof.id  # Add back '04' prefix
-        is_valid = _verify_hash(public_key, hash_hex, proof.signature)
+    # Verify each proof ('04' restores the uncompressed-point prefix the
+    # proof ID omits). Verifies are independent, so heavily multi-signed
+    # transactions fan out over the shared thread pool — but only on the
+    # coincurve backend, which releases the GIL during the C verify call;
+    # the pure-Python backend holds it, so threading would only add cost.
+    proofs = transaction.proofs
+    if len(proofs) >= 4 and _backend.BACKEND == "coincurve":
+        results = list(
+            _backend._get_executor().map(
+                lambda p: _verify_digest("04" + p.id, digest, p.signature), proofs
+            )
+        )
+    else:
+        results = [_verify_digest("04" + proof.id, digest, proof.signature) for proof in proofs]
 
+    for proof, is_valid in zip(proofs, results):
         if is_valid:
             valid_proofs.append(proof)
         else:
@@ -422,6 +523,67 @@ def verify_currency_transaction(transaction: CurrencyTransaction) -> Verificatio
     )
 
 
+def verify_currency_transactions_bulk(
+    transactions: List[CurrencyTransaction],
+) -> List[VerificationResult]:
+    """
+    Verify many currency transactions in one call.
+
+    Bulk entry point for replay/audit workloads (e.g. re-verifying a
+    block range or a mempool snapshot). Hashing stays sequential — it is
+    cheap and feeds the proof list — while every proof across the whole
+    batch is verified on the shared thread pool when the coincurve
+    backend is active (the pure-Python backend holds the GIL, so it
+    runs the proofs sequentially instead).
+
+    Args:
+        transactions: Transactions to verify
+
+    Returns:
+        Verification results, in input order
+
+    Example:
+        >>> results = verify_currency_transactions_bulk(txs)
+        >>> all(r.is_valid for r in results)
+    """
+    # One signing digest per transaction, shared by all its proofs
+    digests = [_prehash(hash_currency_transaction(tx).value) for tx in transactions]
+
+    # Flatten to (transaction index, proof) so one pool covers the batch
+    tasks = [
+        (index, proof)
+        for index, transaction in enumerate(transactions)
+        for proof in transaction.proofs
+    ]
+
+    if len(tasks) >= 4 and _backend.BACKEND == "coincurve":
+        flags = list(
+            _backend._get_executor().map(
+                lambda task: _verify_digest("04" + task[1].id, digests[task[0]], task[1].signature),
+                tasks,
+            )
+        )
+    else:
+        flags = [
+            _verify_digest("04" + proof.id, digests[index], proof.signature)
+            for index, proof in tasks
+        ]
+
+    valid: List[List[SignatureProof]] = [[] for _ in transactions]
+    invalid: List[List[SignatureProof]] = [[] for _ in transactions]
+    for (index, proof), is_valid in zip(tasks, flags):
+        (valid[index] if is_valid else invalid[index]).append(proof)
+
+    return [
+        VerificationResult(
+            is_valid=len(invalid[index]) == 0 and len(valid[index]) > 0,
+            valid_proofs=valid[index],
+            invalid_proofs=invalid[index],
+        )
+        for index in range(len(transactions))
+    ]
+
+
 def encode_currency_transaction(transaction: CurrencyTransaction) -> str:
     """
     Encode a currency transaction for hashing.
@@ -452,11 +614,55 @@ def hash_currency_transaction(transaction: CurrencyTransaction) -> Hash:
         >>> hash_result = hash_currency_transaction(tx)
         >>> print('Hash:', hash_result.value)
     """
+    # Reuse the cached hash when the value is unchanged since it was
+    # computed (a field-snapshot compare is far cheaper than re-encoding
+    # and re-hashing)
+    snapshot = _value_snapshot(transaction.value)
+    cached = transaction._cached_hash
+    if cached is not None and cached[0] == snapshot:
+        result: Hash = cached[1]
+        return result
+
     encoded = _encode_transaction(transaction)
-    serialized = _kryo_serialize(encoded, set_references=False)
+    serialized = _kryo_serialize(encoded.encode("utf-8"), set_references=False)
     hash_bytes = hashlib.sha256(serialized).digest()
 
-    return Hash(value=hash_bytes.hex(), bytes=hash_bytes)
+    result = Hash(value=hash_bytes.hex(), bytes=hash_bytes)
+    transaction._cached_hash = (snapshot, result)
+    return result
+
+
+def hash_currency_transaction_batch(transactions: List[CurrencyTransaction]) -> List[Hash]:
+    """
+    Hash a batch of currency transactions.
+
+    Batch entry point mirroring `hash_many`: a multi-buffer SHA-256
+    implementation can be slotted in here without changing callers. The
+    portable implementation hashes each transaction through
+    `hash_currency_transaction`, so per-transaction hash caching still
+    applies.
+
+    Args:
+        transactions: Transactions to hash
+
+    Returns:
+        List of Hash objects, in input order
+    """
+    return [hash_currency_transaction(transaction) for transaction in transactions]
+
+
+def _value_snapshot(value: CurrencyTransactionValue) -> tuple[str, str, int, int, str, int, str]:
+    """Tuple of all hash-covered value fields, used as a cache key."""
+    parent = value.parent
+    return (
+        value.source,
+        value.destination,
+        value.amount,
+        value.fee,
+        parent.hash,
+        parent.ordinal,
+        value.salt,
+    )
 
 
 def get_transaction_reference(
@@ -505,15 +711,39 @@ def _sign_hash(hash_hex: str, private_key: str) -> str:
     digest = sha512_hash[:32]
 
     # Sign with ECDSA
-    sk = SigningKey.from_string(bytes.fromhex(private_key), curve=SECP256k1)
-    signature_bytes: bytes = sk.sign_digest(digest, sigencode=sigencode_der)
+    return _backend.sign_digest(private_key, digest)
+
 
-    return signature_bytes.hex()
+def _prehash(hash_hex: str) -> bytes:
+    """SHA-512 of the hash's hex digits, truncated to the 32-byte signing digest."""
+    return hashlib.sha512(hash_hex.encode("utf-8")).digest()[:32]
+
+
+@functools.lru_cache(maxsize=8192)
+def _verify_digest(public_key: str, digest: bytes, signature: str) -> bool:
+    """
+    Verify a signature on a prehashed 32-byte digest.
+
+    Results are memoized in a bounded LRU cache so repeated verification
+    of the same (key, digest, signature) triple — mempool rechecks, local
+    verify-before-submit — costs a dict lookup instead of an ECDSA verify.
+    Taking the digest rather than the hash hex lets multi-proof callers
+    pay the SHA-512 prehash once per transaction instead of per proof.
+
+    Args:
+        public_key: Public key in hex format (with 04 prefix)
+        digest: 32-byte signing digest (see `_prehash`)
+        signature: DER-encoded signature in hex format
+
+    Returns:
+        True if signature is valid
+    """
+    return _backend.verify_digest(public_key, signature, digest)
 
 
 def _verify_hash(public_key: str, hash_hex: str, signature: str) -> bool:
     """
-    Verify a signature on a hash.
+    Verify a signature on a hash (prehash + cached digest verify).
 
     Args:
         public_key: Public key in hex format (with 04 prefix)
@@ -523,24 +753,14 @@ def _verify_hash(public_key: str, hash_hex: str, signature: str) -> bool:
     Returns:
         True if signature is valid
     """
-    try:
-        # Hash hex as UTF-8 -> SHA-512 -> truncate 32 bytes
-        hash_utf8 = hash_hex.encode("utf-8")
-        sha512_hash = hashlib.sha512(hash_utf8).digest()
-        digest = sha512_hash[:32]
-
-        # Get verifying key
-        public_key_bytes = bytes.fromhex(public_key)
-        # Remove '04' prefix if present
-        if len(public_key_bytes) == 65 and public_key_bytes[0] == 0x04:
-            public_key_bytes = public_key_bytes[1:]
+    return _verify_digest(public_key, _prehash(hash_hex), signature)
 
-        vk = VerifyingKey.from_string(public_key_bytes, curve=SECP256k1)
 
-        # Verify signature
-        signature_bytes = bytes.fromhex(signature)
-        vk.verify_digest(signature_bytes, digest, sigdecode=sigdecode_der)
+def clear_verification_cache() -> None:
+    """
+    Clear the signature-verification result cache.
 
-        return True
-    except Exception:
-        return False
+    Example:
+        >>> clear_verification_cache()
+    """
+    _verify_digest.cache_clear()
@@ -14,7 +14,7 @@ TOKEN_DECIMALS = 1e-8
 """Token decimals constant (1e-8)."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TransactionReference:
     """Reference to a previous transaction for chaining."""
 
@@ -25,7 +25,7 @@ class TransactionReference:
     """Transaction ordinal number."""
 
 
-@dataclass
+@dataclass(slots=True)
 class CurrencyTransactionValue:
     """
     Currency transaction value structure (v2).
@@ -63,7 +63,7 @@ Used for metagraph token transfers.
 """
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TransferParams:
     """Parameters for creating a token transfer."""
 
@@ -4,10 +4,12 @@ Hashing Utilities.
 SHA-256 and SHA-512 hashing for the Constellation signature protocol.
 """
 
+import binascii
 import hashlib
-from typing import Any
+from typing import Any, Callable, List
 
-from .binary import to_bytes
+from .binary import _PREFIX_BYTES, to_bytes
+from .canonicalize import canonicalize_into
 from .types import Hash
 
 
@@ -45,6 +47,17 @@ def hash_bytes(data: bytes) -> Hash:
     return Hash(value=hex_value, bytes=digest)
 
 
+def _sha256_hex_bytes(data: bytes) -> bytes:
+    """
+    SHA-256 of ``data`` as 64 ASCII-hex bytes.
+
+    Internal fast path for the signing protocol, which feeds the hex
+    digits (not the raw digest) into SHA-512: b2a_hex goes straight to
+    bytes, skipping the str that Hash.value / digest.hex() would allocate.
+    """
+    return binascii.b2a_hex(hashlib.sha256(data).digest())
+
+
 def compute_digest(data: Any, is_data_update: bool = False) -> bytes:
     """
     Compute the full signing digest according to Constellation protocol.
@@ -67,14 +80,118 @@ def compute_digest(data: Any, is_data_update: bool = False) -> bytes:
     # Step 1: Serialize to binary
     data_bytes = to_bytes(data, is_data_update)
 
-    # Step 2: SHA-256 hash
-    sha256_hash = hash_bytes(data_bytes)
-
-    # Step 3-4: Hex string as UTF-8 bytes (critical: NOT hex decode)
-    hex_as_utf8 = sha256_hash.value.encode("utf-8")
+    # Steps 2-4: SHA-256, then its hex digits as ASCII bytes (critical:
+    # NOT the raw digest)
+    hex_as_utf8 = _sha256_hex_bytes(data_bytes)
 
     # Step 5: SHA-512
     sha512_hash = hashlib.sha512(hex_as_utf8).digest()
 
     # Step 6: Truncate to 32 bytes
     return sha512_hash[:32]
+
+
+class _HashSink:
+    """Writable sink that feeds each chunk into a hash update function."""
+
+    def __init__(self, update: Callable[[bytes], Any]):
+        self._update = update
+
+    def write(self, chunk: bytes) -> int:
+        self._update(chunk)
+        return len(chunk)
+
+
+class _CountingSink:
+    """Writable sink that only counts the bytes written to it."""
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def write(self, chunk: bytes) -> int:
+        self.count += len(chunk)
+        return len(chunk)
+
+
+class _Base64Sink:
+    """Writable sink that base64-encodes chunks into a hash update function."""
+
+    def __init__(self, update: Callable[[bytes], Any]):
+        self._update = update
+        self._tail = b""
+
+    def write(self, chunk: bytes) -> int:
+        buf = self._tail + chunk
+        aligned = len(buf) - (len(buf) % 3)
+        if aligned:
+            self._update(binascii.b2a_base64(buf[:aligned], newline=False))
+        self._tail = buf[aligned:]
+        return len(chunk)
+
+    def flush(self) -> None:
+        if self._tail:
+            self._update(binascii.b2a_base64(self._tail, newline=False))
+            self._tail = b""
+
+
+def hash_data_streaming(data: Any, is_data_update: bool = False) -> Hash:
+    """
+    Compute SHA-256 hash of canonical JSON without materializing it.
+
+    Equivalent to `hash_data`, but streams the canonical output (and its
+    base64 encoding for DataUpdates) directly into the hash, so peak
+    memory stays O(chunk) instead of O(payload). Intended for
+    megabyte-scale DataUpdate payloads; for small objects `hash_data`
+    is simpler and just as fast.
+
+    The DataUpdate prefix embeds the base64 length, which is only known
+    from the canonical byte count, so that mode makes one extra counting
+    pass over the canonical output (still without allocating it).
+
+    Args:
+        data: Any JSON-serializable object
+        is_data_update: Whether to apply DataUpdate encoding
+
+    Returns:
+        Hash object with hex string and raw bytes
+    """
+    sha256 = hashlib.sha256()
+
+    if is_data_update:
+        # Pass 1: count canonical bytes to derive the base64 length
+        counter = _CountingSink()
+        canonicalize_into(data, counter)
+        base64_length = (counter.count + 2) // 3 * 4
+
+        # Pass 2: hash prefix, length, and streamed base64 of the canonical bytes
+        sha256.update(_PREFIX_BYTES)
+        sha256.update(str(base64_length).encode("ascii"))
+        sha256.update(b"\n")
+        encoder = _Base64Sink(sha256.update)
+        canonicalize_into(data, encoder)
+        encoder.flush()
+    else:
+        canonicalize_into(data, _HashSink(sha256.update))
+
+    digest = sha256.digest()
+    return Hash(value=digest.hex(), bytes=digest)
+
+
+def hash_many(bufs: List[bytes]) -> List[bytes]:
+    """
+    Compute SHA-512 digests for a batch of independent messages.
+
+    Batch entry point for callers hashing many transactions at once
+    (e.g. batch transaction creation). A SIMD multi-buffer SHA-512
+    implementation can be slotted in here without changing callers;
+    the portable implementation hashes each buffer with hashlib's
+    OpenSSL backend.
+
+    Args:
+        bufs: List of input byte buffers
+
+    Returns:
+        List of 64-byte SHA-512 digests, in input order
+    """
+    sha512 = hashlib.sha512
+    return [sha512(buf).digest() for buf in bufs]
@@ -8,11 +8,8 @@ Implements the Constellation signature protocol.
 import hashlib
 from typing import Any
 
-from ecdsa import SECP256k1, SigningKey
-from ecdsa.util import sigencode_der
-
-from .binary import to_bytes
-from .hash import hash_bytes
+from . import _backend
+from .hash import compute_digest
 from .types import SignatureProof
 
 
@@ -38,16 +35,13 @@ def sign(data: Any, private_key: str) -> SignatureProof:
         >>> print(proof.id)        # public key (128 chars)
         >>> print(proof.signature) # DER signature
     """
-    # Serialize and hash
-    data_bytes = to_bytes(data, is_data_update=False)
-    hash_result = hash_bytes(data_bytes)
-
-    # Sign the hash
-    signature = sign_hash(hash_result.value, private_key)
+    # Serialize, hash, and sign the resulting digest directly — the
+    # intermediate hash hex string never needs to be materialized
+    digest = compute_digest(data, is_data_update=False)
+    signature = _backend.sign_digest(private_key, digest)
 
     # Get public key ID
-    sk = SigningKey.from_string(bytes.fromhex(private_key), curve=SECP256k1)
-    public_key_id = _get_public_key_id(sk)
+    public_key_id = _get_public_key_id(private_key)
 
     return SignatureProof(id=public_key_id, signature=signature)
 
@@ -63,16 +57,12 @@ def sign_data_update(data: Any, private_key: str) -> SignatureProof:
     Returns:
         SignatureProof
     """
-    # Serialize with DataUpdate encoding
-    data_bytes = to_bytes(data, is_data_update=True)
-    hash_result = hash_bytes(data_bytes)
-
-    # Sign the hash
-    signature = sign_hash(hash_result.value, private_key)
+    # Serialize with DataUpdate encoding, hash, and sign the digest
+    digest = compute_digest(data, is_data_update=True)
+    signature = _backend.sign_digest(private_key, digest)
 
     # Get public key ID
-    sk = SigningKey.from_string(bytes.fromhex(private_key), curve=SECP256k1)
-    public_key_id = _get_public_key_id(sk)
+    public_key_id = _get_public_key_id(private_key)
 
     return SignatureProof(id=public_key_id, signature=signature)
 
@@ -102,16 +92,9 @@ def sign_hash(hash_hex: str, private_key: str) -> str:
     truncated_hash = sha512_hash[:32]
 
     # Step 4: Sign with ECDSA
-    sk = SigningKey.from_string(bytes.fromhex(private_key), curve=SECP256k1)
-    signature: bytes = sk.sign_digest(truncated_hash, sigencode=sigencode_der)
-
-    return signature.hex()
+    return _backend.sign_digest(private_key, truncated_hash)
 
 
-def _get_public_key_id(signing_key: SigningKey) -> str:
-    """Get public key ID (without 04 prefix) from signing key."""
-    verifying_key = signing_key.verifying_key
-    x_coord = verifying_key.pubkey.point.x()
-    y_coord = verifying_key.pubkey.point.y()
-    # Return without 04 prefix (128 chars)
-    return f"{x_coord:064x}{y_coord:064x}"
+def _get_public_key_id(private_key: str) -> str:
+    """Get public key ID (without 04 prefix) from a private key."""
+    return _backend.public_key_from_private(private_key)[2:]
@@ -4,9 +4,13 @@ High-Level Signed Object API.
 Convenience functions for creating and managing signed objects.
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, TypeVar
 
-from .sign import sign, sign_data_update
+from . import _backend
+from .hash import compute_digest
+from .sign import _get_public_key_id, sign, sign_data_update
 from .types import SignatureProof, Signed
 
 T = TypeVar("T")
@@ -93,9 +97,25 @@ def batch_sign(value: T, private_keys: List[str], is_data_update: bool = False)
     if not private_keys:
         raise ValueError("At least one private key is required")
 
-    proofs: List[SignatureProof] = []
-    for key in private_keys:
-        proof = sign_data_update(value, key) if is_data_update else sign(value, key)
-        proofs.append(proof)
+    # The value is the same for every signer, so canonicalize and hash it
+    # once instead of once per key
+    digest = compute_digest(value, is_data_update)
+
+    def _build_proof(key: str) -> SignatureProof:
+        return SignatureProof(
+            id=_get_public_key_id(key), signature=_backend.sign_digest(key, digest)
+        )
+
+    # Signs are independent per key; the libsecp256k1 backend releases
+    # the GIL during the C call, so threads scale across cores. The
+    # pure-Python backend holds the GIL throughout, so it takes the
+    # sequential loop instead.
+    if len(private_keys) > 1 and _backend.BACKEND == "coincurve":
+        with ThreadPoolExecutor(
+            max_workers=min(len(private_keys), os.cpu_count() or 1)
+        ) as executor:
+            proofs = list(executor.map(_build_proof, private_keys))
+    else:
+        proofs = [_build_proof(key) for key in private_keys]
 
     return Signed(value=value, proofs=proofs)
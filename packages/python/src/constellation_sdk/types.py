@@ -3,12 +3,12 @@ Core type definitions for the Constellation Metagraph SDK.
 """
 
 from dataclasses import dataclass, field
-from typing import Generic, List, TypeVar
+from typing import Any, Generic, List, Optional, TypeVar
 
 T = TypeVar("T")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SignatureProof:
     """A signature proof containing the signer's public key ID and signature."""
 
@@ -19,7 +19,7 @@ class SignatureProof:
     """DER-encoded ECDSA signature in hex format."""
 
 
-@dataclass
+@dataclass(slots=True)
 class Signed(Generic[T]):
     """A signed object wrapping a value with one or more signature proofs."""
 
@@ -29,12 +29,17 @@ class Signed(Generic[T]):
     proofs: List[SignatureProof] = field(default_factory=list)
     """List of signature proofs."""
 
+    _cached_hash: Optional[Any] = field(default=None, init=False, repr=False, compare=False)
+    """Internal: cached transaction hash keyed to a snapshot of the value."""
+
     def add_proof(self, proof: SignatureProof) -> "Signed[T]":
         """Return a new Signed object with an additional proof."""
-        return Signed(value=self.value, proofs=[*self.proofs, proof])
+        signed = Signed(value=self.value, proofs=[*self.proofs, proof])
+        signed._cached_hash = self._cached_hash
+        return signed
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class KeyPair:
     """A key pair for signing operations."""
 
@@ -48,7 +53,7 @@ class KeyPair:
     """DAG address derived from the public key."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Hash:
     """A hash result containing both hex string and raw bytes."""
 
@@ -59,7 +64,7 @@ class Hash:
     """Raw 32-byte hash."""
 
 
-@dataclass
+@dataclass(slots=True)
 class VerificationResult:
     """Result of signature verification."""
 
@@ -5,25 +5,63 @@ Verify ECDSA signatures using secp256k1 curve.
 """
 
 import hashlib
-from typing import Any, TypeVar
+from typing import Any, List, Optional, TypeVar
 
-from ecdsa import SECP256k1, VerifyingKey
-from ecdsa.util import sigdecode_der
-
-from .binary import to_bytes
-from .hash import hash_bytes
+from . import _backend
+from .hash import compute_digest
 from .types import SignatureProof, Signed, VerificationResult
 
 T = TypeVar("T")
 
+ENABLE_THREADED_VERIFY = _backend.BACKEND == "coincurve"
+"""Fan multi-proof verification out over the shared thread pool.
+
+Defaults to True only on the coincurve backend, which releases the GIL
+inside libsecp256k1; the pure-Python backend holds the GIL throughout,
+so threading it would only add overhead.
+"""
+
+
+class ValidatorRegistry:
+    """
+    Pre-parsed verification keys for a known validator set.
+
+    Verification pipelines that check signatures from the same small set
+    of signers across many objects (block ranges, snapshot streams) can
+    build one registry and pass it to `verify()`: each signer's key is
+    parsed and curve-validated once and pinned for the registry's
+    lifetime, independent of the bounded module-level cache.
+
+    Example:
+        >>> registry = ValidatorRegistry()
+        >>> for block in blocks:
+        ...     result = verify(block, registry=registry)
+    """
+
+    def __init__(self) -> None:
+        self._keys: dict[str, Any] = {}
+
+    def get_vk(self, public_key: str) -> Any:
+        """Return the parsed key object for a public key hex, caching it."""
+        key = self._keys.get(public_key)
+        if key is None:
+            key = _backend._load_public_key(public_key)
+            self._keys[public_key] = key
+        return key
 
-def verify(signed: Signed[T], is_data_update: bool = False) -> VerificationResult:
+
+def verify(
+    signed: Signed[T],
+    is_data_update: bool = False,
+    registry: Optional[ValidatorRegistry] = None,
+) -> VerificationResult:
     """
     Verify a signed object.
 
     Args:
         signed: Signed object with value and proofs
         is_data_update: Whether the value was signed as a DataUpdate
+        registry: Optional pre-parsed key registry for fixed signer sets
 
     Returns:
         VerificationResult with valid/invalid proof lists
@@ -33,23 +71,32 @@ def verify(signed: Signed[T], is_data_update: bool = False) -> VerificationResul
         >>> if result.is_valid:
         ...     print("All signatures valid")
     """
-    # Compute the hash that should have been signed
-    data_bytes = to_bytes(signed.value, is_data_update)
-    hash_result = hash_bytes(data_bytes)
+    # Compute the signing digest once — it is identical for every proof,
+    # and compute_digest never materializes the intermediate hash hex
+    digest = compute_digest(signed.value, is_data_update)
 
-    valid_proofs: list[SignatureProof] = []
-    invalid_proofs: list[SignatureProof] = []
-
-    for proof in signed.proofs:
+    def _check(proof: SignatureProof) -> bool:
         try:
-            is_valid = verify_hash(hash_result.value, proof.signature, proof.id)
-            if is_valid:
-                valid_proofs.append(proof)
-            else:
-                invalid_proofs.append(proof)
+            if registry is not None:
+                return _backend.verify_digest_with_key(
+                    registry.get_vk(proof.id), proof.signature, digest
+                )
+            return _backend.verify_digest(proof.id, proof.signature, digest)
         except Exception:
             # Verification error = invalid
-            invalid_proofs.append(proof)
+            return False
+
+    if ENABLE_THREADED_VERIFY and len(signed.proofs) >= 2:
+        # Independent ECDSA verifies run in parallel on the shared pool;
+        # the coincurve backend drops the GIL inside the C call
+        flags = list(_backend._get_executor().map(_check, signed.proofs))
+    else:
+        flags = [_check(proof) for proof in signed.proofs]
+
+    valid_proofs: list[SignatureProof] = []
+    invalid_proofs: list[SignatureProof] = []
+    for proof, is_valid in zip(signed.proofs, flags):
+        (valid_proofs if is_valid else invalid_proofs).append(proof)
 
     return VerificationResult(
         is_valid=len(invalid_proofs) == 0 and len(valid_proofs) > 0,
@@ -58,6 +105,108 @@ def verify(signed: Signed[T], is_data_update: bool = False) -> VerificationResul
     )
 
 
+def verify_many_proofs(hash_hex: str, proofs: List[SignatureProof]) -> VerificationResult:
+    """
+    Verify several proofs against one pre-computed SHA-256 hash.
+
+    The protocol's SHA-512 prehash of the hex digits is identical for
+    every proof, so it is computed once here instead of per proof; with
+    four or more proofs on the coincurve backend the independent ECDSA
+    verifies fan out over the shared thread pool (libsecp256k1 releases
+    the GIL during the C call).
+
+    Args:
+        hash_hex: SHA-256 hash as 64-character hex string
+        proofs: Signature proofs to verify against the hash
+
+    Returns:
+        VerificationResult with valid/invalid proof lists
+    """
+    digest = _prehash(hash_hex)
+
+    if ENABLE_THREADED_VERIFY and len(proofs) >= 4:
+        results = list(
+            _backend._get_executor().map(
+                lambda p: _backend.verify_digest(p.id, p.signature, digest), proofs
+            )
+        )
+    else:
+        results = [_backend.verify_digest(proof.id, proof.signature, digest) for proof in proofs]
+
+    valid_proofs: list[SignatureProof] = []
+    invalid_proofs: list[SignatureProof] = []
+    for proof, is_valid in zip(proofs, results):
+        (valid_proofs if is_valid else invalid_proofs).append(proof)
+
+    return VerificationResult(
+        is_valid=len(invalid_proofs) == 0 and len(valid_proofs) > 0,
+        valid_proofs=valid_proofs,
+        invalid_proofs=invalid_proofs,
+    )
+
+
+def verify_batch(
+    signeds: List[Signed[T]], is_data_update: bool = False
+) -> List[VerificationResult]:
+    """
+    Verify many signed objects in one call.
+
+    Payloads are hashed sequentially (cheap), then every proof across the
+    whole batch is verified on the shared thread pool when the coincurve
+    backend is active (the pure-Python backend holds the GIL, so it runs
+    the proofs sequentially instead).
+
+    Args:
+        signeds: Signed objects to verify
+        is_data_update: Whether the values were signed as DataUpdates
+
+    Returns:
+        Verification results, in input order
+
+    Example:
+        >>> results = verify_batch(signed_objects)
+        >>> all(r.is_valid for r in results)
+    """
+    digests = [compute_digest(s.value, is_data_update) for s in signeds]
+
+    # Flatten to (object index, proof) so one pool covers the batch
+    tasks = [(index, proof) for index, signed in enumerate(signeds) for proof in signed.proofs]
+
+    if ENABLE_THREADED_VERIFY and len(tasks) >= 4:
+        flags = list(
+            _backend._get_executor().map(
+                lambda task: _backend.verify_digest(
+                    task[1].id, task[1].signature, digests[task[0]]
+                ),
+                tasks,
+            )
+        )
+    else:
+        flags = [
+            _backend.verify_digest(proof.id, proof.signature, digests[index])
+            for index, proof in tasks
+        ]
+
+    valid: List[List[SignatureProof]] = [[] for _ in signeds]
+    invalid: List[List[SignatureProof]] = [[] for _ in signeds]
+    for (index, proof), is_valid in zip(tasks, flags):
+        (valid[index] if is_valid else invalid[index]).append(proof)
+
+    return [
+        VerificationResult(
+            is_valid=len(invalid[index]) == 0 and len(valid[index]) > 0,
+            valid_proofs=valid[index],
+            invalid_proofs=invalid[index],
+        )
+        for index in range(len(signeds))
+    ]
+
+
+def _prehash(hash_hex: str) -> bytes:
+    """SHA-512 of the hash's hex digits, truncated to the 32-byte signing digest."""
+    return hashlib.sha512(hash_hex.encode("utf-8")).digest()[:32]
+
+
 def verify_hash(hash_hex: str, signature: str, public_key_id: str) -> bool:
     """
     Verify a signature against a SHA-256 hash.
@@ -76,26 +225,25 @@ def verify_hash(hash_hex: str, signature: str, public_key_id: str) -> bool:
     Returns:
         True if signature is valid
     """
-    try:
-        # Step 1-2: Hash hex as UTF-8, then SHA-512
-        hex_as_utf8 = hash_hex.encode("utf-8")
-        sha512_hash = hashlib.sha512(hex_as_utf8).digest()
-
-        # Step 3: Truncate to 32 bytes
-        truncated_hash = sha512_hash[:32]
-
-        # Normalize public key (add 04 prefix if needed)
-        full_public_key = _normalize_public_key(public_key_id)
+    # Cheap length checks first: obviously malformed inputs return False
+    # here instead of raising (and unwinding) deep inside the backend.
+    # The signature bound admits both 64-byte compact and DER encodings;
+    # hex-digit validation happens once, during the backend's decode.
+    if len(hash_hex) != 64 or len(public_key_id) not in (128, 130):
+        return False
+    if not 16 <= len(signature) <= 144 or len(signature) % 2:
+        return False
 
-        # Step 4: Verify with ecdsa
-        vk = VerifyingKey.from_string(bytes.fromhex(full_public_key), curve=SECP256k1)
-        result: bool = vk.verify_digest(
-            bytes.fromhex(signature), truncated_hash, sigdecode=sigdecode_der
-        )
-        return result
+    try:
+        # Steps 1-3: Hash hex as UTF-8 -> SHA-512 -> truncate
+        truncated_hash = _prehash(hash_hex)
     except Exception:
         return False
 
+    # Step 4: Verify with the active ECDSA backend (handles the optional
+    # 04 prefix and returns False on any malformed input)
+    return _backend.verify_digest(public_key_id, signature, truncated_hash)
+
 
 def verify_signature(data: Any, proof: SignatureProof, is_data_update: bool = False) -> bool:
     """
@@ -109,16 +257,5 @@ def verify_signature(data: Any, proof: SignatureProof, is_data_update: bool = Fa
     Returns:
         True if signature is valid
     """
-    data_bytes = to_bytes(data, is_data_update)
-    hash_result = hash_bytes(data_bytes)
-    return verify_hash(hash_result.value, proof.signature, proof.id)
-
-
-def _normalize_public_key(public_key: str) -> str:
-    """Normalize public key to full format (without 04 prefix for ecdsa library)."""
-    # ecdsa library expects uncompressed key without 04 prefix
-    if public_key.startswith("04") and len(public_key) == 130:
-        return public_key[2:]
-    if len(public_key) == 128:
-        return public_key
-    return public_key
+    digest = compute_digest(data, is_data_update)
+    return _backend.verify_digest(proof.id, proof.signature, digest)
@@ -4,13 +4,19 @@ Wallet and Key Management Utilities.
 Functions for generating and managing cryptographic keys.
 """
 
+import functools
 import hashlib
-import re
-
-from ecdsa import SECP256k1, SigningKey
 
+from . import _backend
 from .types import KeyPair
 
+try:
+    # Bind OpenSSL's constructor directly, skipping the hashlib dispatch
+    # wrapper on the single-shot 65-byte hash in get_address
+    from _hashlib import openssl_sha256 as _sha256
+except ImportError:  # pragma: no cover - non-OpenSSL builds
+    _sha256 = hashlib.sha256
+
 
 def generate_key_pair() -> KeyPair:
     """
@@ -25,15 +31,20 @@ def generate_key_pair() -> KeyPair:
         >>> print(key_pair.private_key) # 64 char hex
         >>> print(key_pair.public_key)  # 130 char hex (with 04 prefix)
     """
-    sk = SigningKey.generate(curve=SECP256k1)
-    private_key = sk.to_string().hex()
+    private_key = _backend.generate_private_key()
     return key_pair_from_private_key(private_key)
 
 
+@functools.lru_cache(maxsize=128)
 def key_pair_from_private_key(private_key: str) -> KeyPair:
     """
     Derive a key pair from an existing private key.
 
+    Results are memoized (bounded LRU): deriving the address costs a
+    scalar multiplication, and clients sending many transactions from
+    the same key would otherwise redo it per transaction. Call
+    ``key_pair_from_private_key.cache_clear()`` to drop cached keys.
+
     Args:
         private_key: Private key in hex format (64 characters)
 
@@ -43,13 +54,8 @@ def key_pair_from_private_key(private_key: str) -> KeyPair:
     Example:
         >>> key_pair = key_pair_from_private_key(existing_private_key)
     """
-    sk = SigningKey.from_string(bytes.fromhex(private_key), curve=SECP256k1)
-    vk = sk.verifying_key
-
     # Get uncompressed public key (with 04 prefix)
-    x_coord = vk.pubkey.point.x()
-    y_coord = vk.pubkey.point.y()
-    public_key = f"04{x_coord:064x}{y_coord:064x}"
+    public_key = _backend.public_key_from_private(private_key)
 
     # Derive DAG address
     address = get_address(public_key)
@@ -57,6 +63,21 @@ def key_pair_from_private_key(private_key: str) -> KeyPair:
     return KeyPair(private_key=private_key, public_key=public_key, address=address)
 
 
+def clear_key_cache() -> None:
+    """
+    Drop all cached key material (derived key pairs and backend key objects).
+
+    Key derivation results are memoized for performance; call this to
+    evict them, e.g. after a long-lived process is done with a key.
+
+    Example:
+        >>> clear_key_cache()
+    """
+    key_pair_from_private_key.cache_clear()
+    get_address.cache_clear()
+    _backend.clear_key_cache()
+
+
 def get_public_key_hex(private_key: str, compressed: bool = False) -> str:
     """
     Get the public key hex from a private key.
@@ -68,17 +89,7 @@ def get_public_key_hex(private_key: str, compressed: bool = False) -> str:
     Returns:
         Public key in hex format
     """
-    sk = SigningKey.from_string(bytes.fromhex(private_key), curve=SECP256k1)
-    vk = sk.verifying_key
-
-    x_coord = vk.pubkey.point.x()
-    y_coord = vk.pubkey.point.y()
-
-    if compressed:
-        prefix = "02" if y_coord % 2 == 0 else "03"
-        return f"{prefix}{x_coord:064x}"
-    else:
-        return f"04{x_coord:064x}{y_coord:064x}"
+    return _backend.public_key_from_private(private_key, compressed=compressed)
 
 
 def get_public_key_id(private_key: str) -> str:
@@ -98,10 +109,15 @@ def get_public_key_id(private_key: str) -> str:
     return public_key[2:]
 
 
+@functools.lru_cache(maxsize=4096)
 def get_address(public_key: str) -> str:
     """
     Get DAG address from a public key.
 
+    Results are memoized (bounded LRU): signing workloads derive the
+    same signer's address over and over, and the hash + base58 work
+    reduces to a dict lookup on repeats.
+
     Uses Constellation's address derivation:
     1. SHA-256 hash of public key bytes (with 04 prefix)
     2. Base58 encode
@@ -115,19 +131,13 @@ def get_address(public_key: str) -> str:
     Returns:
         DAG address string (40 characters: DAG + parity + 36 chars)
     """
-    # PKCS prefix for X.509 DER encoding (secp256k1)
-    PKCS_PREFIX = "3056301006072a8648ce3d020106052b8104000a034200"
-
     # Normalize public key to include 04 prefix
     if not public_key.startswith("04"):
         public_key = "04" + public_key
 
-    # Prepend PKCS prefix
-    pkcs_encoded = PKCS_PREFIX + public_key
-
-    # SHA-256 hash
-    pkcs_bytes = bytes.fromhex(pkcs_encoded)
-    hash_bytes = hashlib.sha256(pkcs_bytes).digest()
+    # Prepend PKCS prefix (pre-decoded) and SHA-256 hash
+    pkcs_bytes = _PKCS_PREFIX_BYTES + bytes.fromhex(public_key)
+    hash_bytes = _sha256(pkcs_bytes).digest()
 
     # Base58 encode
     base58_encoded = _base58_encode(hash_bytes)
@@ -135,8 +145,10 @@ def get_address(public_key: str) -> str:
     # Take last 36 characters
     last36 = base58_encoded[-36:]
 
-    # Calculate parity digit (sum of numeric characters mod 9)
-    digit_sum = sum(int(c) for c in last36 if c.isdigit())
+    # Calculate parity digit (sum of numeric characters mod 9). The
+    # translate table maps each digit byte to its value and everything
+    # else to zero, so the sum runs at C speed over the 36 bytes.
+    digit_sum = sum(last36.encode("ascii").translate(_DIGIT_VALUES))
     parity = digit_sum % 9
 
     # Return with DAG prefix, parity, and last36
@@ -157,7 +169,16 @@ def is_valid_private_key(private_key: str) -> bool:
         return False
     if len(private_key) != 64:
         return False
-    return bool(re.match(r"^[0-9a-fA-F]+$", private_key))
+    if not private_key.isalnum():
+        # bytes.fromhex skips ASCII whitespace (all of it since 3.11);
+        # a hex key must contain hex digits only
+        return False
+    # bytes.fromhex is a C-level validator, much faster than a regex scan
+    try:
+        bytes.fromhex(private_key)
+        return True
+    except ValueError:
+        return False
 
 
 def is_valid_public_key(public_key: str) -> bool:
@@ -175,31 +196,50 @@ def is_valid_public_key(public_key: str) -> bool:
     # With 04 prefix: 130 chars, without: 128 chars
     if len(public_key) not in (128, 130):
         return False
-    return bool(re.match(r"^[0-9a-fA-F]+$", public_key))
+    if not public_key.isalnum():
+        # bytes.fromhex skips ASCII whitespace (all of it since 3.11);
+        # a hex key must contain hex digits only
+        return False
+    # bytes.fromhex is a C-level validator, much faster than a regex scan
+    try:
+        bytes.fromhex(public_key)
+        return True
+    except ValueError:
+        return False
+
 
+# PKCS prefix for X.509 DER encoding (secp256k1), pre-decoded
+_PKCS_PREFIX_BYTES = bytes.fromhex("3056301006072a8648ce3d020106052b8104000a034200")
+
+# Byte-value table for the address parity digit: '0'-'9' -> 0-9, rest -> 0
+_DIGIT_VALUES = bytes(i - 48 if 48 <= i <= 57 else 0 for i in range(256))
 
 # Base58 alphabet (Bitcoin/Constellation style)
 _BASE58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
 
+# Ten base58 digits per big-int division (see _base58_encode)
+_BASE58_CHUNK = 58**10
+
 
 def _base58_encode(data: bytes) -> str:
     """Base58 encode bytes."""
-    # Count leading zeros
-    leading_zeros = 0
-    for byte in data:
-        if byte == 0:
-            leading_zeros += 1
-        else:
-            break
+    # Count leading zeros (each encodes as '1')
+    leading_zeros = len(data) - len(data.lstrip(b"\x00"))
 
     # Convert to integer
     num = int.from_bytes(data, "big")
 
-    # Encode
-    result = ""
+    # Peel ten digits per divmod: far fewer big-int divisions than
+    # dividing by 58 directly, and the digit list avoids the quadratic
+    # string prepending of building the result front-to-back
+    digits = []  # least-significant first
+    while num >= _BASE58_CHUNK:
+        num, chunk = divmod(num, _BASE58_CHUNK)
+        for _ in range(10):
+            chunk, remainder = divmod(chunk, 58)
+            digits.append(_BASE58_ALPHABET[remainder])
     while num > 0:
         num, remainder = divmod(num, 58)
-        result = _BASE58_ALPHABET[remainder] + result
+        digits.append(_BASE58_ALPHABET[remainder])
 
-    # Add leading '1's for each leading zero byte
-    return "1" * leading_zeros + result
+    return "1" * leading_zeros + "".join(reversed(digits))
@@ -0,0 +1,24 @@
+"""Shared fixtures for the test suite."""
+
+import pytest
+
+from constellation_sdk import generate_key_pair
+
+
+@pytest.fixture(scope="session")
+def key_pool():
+    """
+    Pregenerated key pairs shared across the whole test run.
+
+    Key generation costs a secp256k1 scalar multiplication plus address
+    derivation, and most tests only need *some* valid key pair, not a
+    fresh one. Drawing from this pool collapses hundreds of derivations
+    per run down to eight.
+    """
+    return [generate_key_pair() for _ in range(8)]
+
+
+@pytest.fixture
+def kp(key_pool):
+    """Per-test iterator over the key pool: ``a, b = next(kp), next(kp)``."""
+    return iter(key_pool)
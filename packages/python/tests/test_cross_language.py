@@ -7,67 +7,78 @@ import pytest
 
 from constellation_sdk import canonicalize, hash_bytes, to_bytes, verify_hash
 
+_VECTORS_PATH = Path(__file__).parent.parent.parent.parent / "shared" / "test_vectors.json"
 
-@pytest.fixture
+# Loaded once at import so parametrized tests share a single parse
+with open(_VECTORS_PATH) as f:
+    TEST_VECTORS = json.load(f)
+
+
+def _vector_id(vector):
+    """Readable per-vector test id, e.g. 'python-TestData'."""
+    return f"{vector['source']}-{vector['type']}"
+
+
+@pytest.fixture(scope="session")
 def test_vectors():
-    """Load test vectors from shared file."""
-    vectors_path = Path(__file__).parent.parent.parent.parent / "shared" / "test_vectors.json"
-    with open(vectors_path) as f:
-        return json.load(f)
+    """Test vectors from the shared file."""
+    return TEST_VECTORS
 
 
 class TestCanonicalJson:
     """Test canonical JSON matches all test vectors."""
 
-    def test_all_vectors(self, test_vectors):
-        """Canonical JSON should match all test vectors."""
-        for vector in test_vectors:
-            canonical = canonicalize(vector["data"])
-            assert (
-                canonical == vector["canonical_json"]
-            ), f"Mismatch for {vector['source']} {vector['type']}"
+    @pytest.mark.parametrize("vector", TEST_VECTORS, ids=_vector_id)
+    def test_all_vectors(self, vector):
+        """Canonical JSON should match each test vector."""
+        canonical = canonicalize(vector["data"])
+        assert canonical == vector["canonical_json"]
 
 
 class TestBinaryEncoding:
     """Test binary encoding matches all test vectors."""
 
-    def test_all_vectors(self, test_vectors):
-        """UTF-8 bytes should match all test vectors."""
-        for vector in test_vectors:
-            is_data_update = vector["type"] == "TestDataUpdate"
-            result = to_bytes(vector["data"], is_data_update)
-            result_hex = result.hex()
-            assert (
-                result_hex == vector["utf8_bytes_hex"]
-            ), f"Mismatch for {vector['source']} {vector['type']}"
+    @pytest.mark.parametrize("vector", TEST_VECTORS, ids=_vector_id)
+    def test_all_vectors(self, vector):
+        """UTF-8 bytes should match each test vector."""
+        is_data_update = vector["type"] == "TestDataUpdate"
+        result = to_bytes(vector["data"], is_data_update)
+        assert result.hex() == vector["utf8_bytes_hex"]
 
 
 class TestHashing:
     """Test SHA-256 hashes match all test vectors."""
 
-    def test_all_vectors(self, test_vectors):
-        """SHA-256 hashes should match all test vectors."""
-        for vector in test_vectors:
-            is_data_update = vector["type"] == "TestDataUpdate"
-            data_bytes = to_bytes(vector["data"], is_data_update)
-            hash_result = hash_bytes(data_bytes)
-            assert (
-                hash_result.value == vector["sha256_hash_hex"]
-            ), f"Mismatch for {vector['source']} {vector['type']}"
+    @pytest.mark.parametrize("vector", TEST_VECTORS, ids=_vector_id)
+    def test_all_vectors(self, vector):
+        """SHA-256 hashes should match each test vector."""
+        is_data_update = vector["type"] == "TestDataUpdate"
+        data_bytes = to_bytes(vector["data"], is_data_update)
+        hash_result = hash_bytes(data_bytes)
+        assert hash_result.value == vector["sha256_hash_hex"]
 
 
 class TestSignatureVerification:
     """Test signature verification for all test vectors."""
 
-    def test_all_signatures_valid(self, test_vectors):
-        """All signatures from test vectors should verify."""
-        for vector in test_vectors:
-            is_valid = verify_hash(
-                vector["sha256_hash_hex"],
-                vector["signature_hex"],
-                vector["public_key_hex"],
-            )
-            assert is_valid, f"Signature invalid for {vector['source']} {vector['type']}"
+    @pytest.mark.parametrize("vector", TEST_VECTORS, ids=_vector_id)
+    def test_all_signatures_valid(self, vector):
+        """Each signature from the test vectors should verify."""
+        is_valid = verify_hash(
+            vector["sha256_hash_hex"],
+            vector["signature_hex"],
+            vector["public_key_hex"],
+        )
+        assert is_valid
+
+    def test_wrong_prefix_key_rejected(self, test_vectors):
+        """Keys with an invalid point-format prefix should be rejected."""
+        vector = test_vectors[0]
+        # 0x05 is not a valid SEC1 point format; both backends must
+        # reject it rather than silently dropping the prefix byte
+        bad_key = "05" + vector["public_key_hex"][2:]
+        is_valid = verify_hash(vector["sha256_hash_hex"], vector["signature_hex"], bad_key)
+        assert not is_valid
 
     def test_tampered_signature_rejected(self, test_vectors):
         """Tampered signatures should be rejected."""
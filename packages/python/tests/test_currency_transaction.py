@@ -9,7 +9,6 @@ from constellation_sdk import (
     create_currency_transaction,
     create_currency_transaction_batch,
     encode_currency_transaction,
-    generate_key_pair,
     get_transaction_reference,
     hash_currency_transaction,
     is_valid_dag_address,
@@ -29,6 +28,14 @@ class TestUtilityFunctions:
         assert token_to_units(0.00000001) == 1
         assert token_to_units(1) == 100000000
 
+    def test_token_to_units_accepts_str_and_decimal(self):
+        """Test conversion from string and Decimal amounts."""
+        from decimal import Decimal
+
+        assert token_to_units("100.5") == 10050000000
+        assert token_to_units("0.00000001") == 1
+        assert token_to_units(Decimal("0.1")) == 10000000
+
     def test_units_to_token_converts_correctly(self):
         """Test units to token conversion."""
         assert units_to_token(10050000000) == 100.5
@@ -39,9 +46,9 @@ class TestUtilityFunctions:
         """Test TOKEN_DECIMALS constant."""
         assert TOKEN_DECIMALS == 1e-8
 
-    def test_is_valid_dag_address_validates_addresses(self):
+    def test_is_valid_dag_address_validates_addresses(self, kp):
         """Test DAG address validation."""
-        key_pair = generate_key_pair()
+        key_pair = next(kp)
         assert is_valid_dag_address(key_pair.address) is True
         assert is_valid_dag_address("invalid") is False
         assert is_valid_dag_address("") is False
@@ -51,10 +58,10 @@ class TestUtilityFunctions:
 class TestTransactionCreation:
     """Test transaction creation."""
 
-    def test_create_currency_transaction_creates_valid_transaction(self):
+    def test_create_currency_transaction_creates_valid_transaction(self, kp):
         """Test creating a valid currency transaction."""
-        key_pair = generate_key_pair()
-        key_pair2 = generate_key_pair()
+        key_pair = next(kp)
+        key_pair2 = next(kp)
 
         last_ref = TransactionReference(hash="a" * 64, ordinal=0)
 
@@ -74,9 +81,9 @@ class TestTransactionCreation:
         assert hasattr(tx.proofs[0], "id")
         assert hasattr(tx.proofs[0], "signature")
 
-    def test_create_currency_transaction_throws_on_invalid_destination(self):
+    def test_create_currency_transaction_throws_on_invalid_destination(self, kp):
         """Test that invalid destination address raises error."""
-        key_pair = generate_key_pair()
+        key_pair = next(kp)
         last_ref = TransactionReference(hash="a" * 64, ordinal=0)
 
         with pytest.raises(ValueError, match="Invalid destination address"):
@@ -86,9 +93,9 @@ class TestTransactionCreation:
                 last_ref,
             )
 
-    def test_create_currency_transaction_throws_on_same_address(self):
+    def test_create_currency_transaction_throws_on_same_address(self, kp):
         """Test that same source and destination raises error."""
-        key_pair = generate_key_pair()
+        key_pair = next(kp)
         last_ref = TransactionReference(hash="a" * 64, ordinal=0)
 
         with pytest.raises(ValueError, match="Source and destination addresses cannot be the same"):
@@ -98,10 +105,10 @@ class TestTransactionCreation:
                 last_ref,
             )
 
-    def test_create_currency_transaction_throws_on_amount_too_small(self):
+    def test_create_currency_transaction_throws_on_amount_too_small(self, kp):
         """Test that amount too small raises error."""
-        key_pair = generate_key_pair()
-        key_pair2 = generate_key_pair()
+        key_pair = next(kp)
+        key_pair2 = next(kp)
         last_ref = TransactionReference(hash="a" * 64, ordinal=0)
 
         with pytest.raises(ValueError, match="Transfer amount must be greater than 1e-8"):
@@ -111,10 +118,10 @@ class TestTransactionCreation:
                 last_ref,
             )
 
-    def test_create_currency_transaction_throws_on_negative_fee(self):
+    def test_create_currency_transaction_throws_on_negative_fee(self, kp):
         """Test that negative fee raises error."""
-        key_pair = generate_key_pair()
-        key_pair2 = generate_key_pair()
+        key_pair = next(kp)
+        key_pair2 = next(kp)
         last_ref = TransactionReference(hash="a" * 64, ordinal=0)
 
         with pytest.raises(ValueError, match="Fee must be greater than or equal to zero"):
@@ -128,12 +135,12 @@ class TestTransactionCreation:
 class TestBatchTransactions:
     """Test batch transaction creation."""
 
-    def test_create_currency_transaction_batch_creates_multiple(self):
+    def test_create_currency_transaction_batch_creates_multiple(self, kp):
         """Test creating multiple transactions in a batch."""
-        key_pair = generate_key_pair()
-        recipient1 = generate_key_pair()
-        recipient2 = generate_key_pair()
-        recipient3 = generate_key_pair()
+        key_pair = next(kp)
+        recipient1 = next(kp)
+        recipient2 = next(kp)
+        recipient3 = next(kp)
 
         last_ref = TransactionReference(hash="a" * 64, ordinal=5)
 
@@ -159,10 +166,10 @@ class TestBatchTransactions:
 class TestTransactionVerification:
     """Test transaction verification."""
 
-    def test_verify_currency_transaction_validates_correct_signatures(self):
+    def test_verify_currency_transaction_validates_correct_signatures(self, kp):
         """Test that correct signatures verify successfully."""
-        key_pair = generate_key_pair()
-        key_pair2 = generate_key_pair()
+        key_pair = next(kp)
+        key_pair2 = next(kp)
         last_ref = TransactionReference(hash="a" * 64, ordinal=0)
 
         tx = create_currency_transaction(
@@ -177,12 +184,12 @@ class TestTransactionVerification:
         assert len(result.valid_proofs) == 1
         assert len(result.invalid_proofs) == 0
 
-    def test_verify_currency_transaction_detects_invalid_signatures(self):
+    def test_verify_currency_transaction_detects_invalid_signatures(self, kp):
         """Test that invalid signatures are detected."""
         from constellation_sdk import SignatureProof
 
-        key_pair = generate_key_pair()
-        key_pair2 = generate_key_pair()
+        key_pair = next(kp)
+        key_pair2 = next(kp)
         last_ref = TransactionReference(hash="a" * 64, ordinal=0)
 
         tx = create_currency_transaction(
@@ -204,11 +211,11 @@ class TestTransactionVerification:
 class TestMultiSignatureSupport:
     """Test multi-signature functionality."""
 
-    def test_sign_currency_transaction_adds_additional_signature(self):
+    def test_sign_currency_transaction_adds_additional_signature(self, kp):
         """Test adding additional signature to a transaction."""
-        key_pair1 = generate_key_pair()
-        key_pair2 = generate_key_pair()
-        recipient = generate_key_pair()
+        key_pair1 = next(kp)
+        key_pair2 = next(kp)
+        recipient = next(kp)
         last_ref = TransactionReference(hash="a" * 64, ordinal=0)
 
         # Create transaction with first signature
@@ -236,10 +243,10 @@ class TestMultiSignatureSupport:
 class TestTransactionHashing:
     """Test transaction hashing."""
 
-    def test_hash_currency_transaction_produces_consistent_hashes(self):
+    def test_hash_currency_transaction_produces_consistent_hashes(self, kp):
         """Test that hashing produces consistent results."""
-        key_pair = generate_key_pair()
-        key_pair2 = generate_key_pair()
+        key_pair = next(kp)
+        key_pair2 = next(kp)
         last_ref = TransactionReference(hash="a" * 64, ordinal=0)
 
         tx = create_currency_transaction(
@@ -255,10 +262,33 @@ class TestTransactionHashing:
         assert len(hash1.value) == 64  # SHA-256 hex string
         assert len(hash1.bytes) == 32  # 32 bytes
 
-    def test_get_transaction_reference_creates_correct_reference(self):
+    def test_hash_currency_transaction_batch_matches_scalar(self, kp):
+        """Test that batch hashing agrees with per-transaction hashing."""
+        from constellation_sdk import hash_currency_transaction_batch
+
+        key_pair = next(kp)
+        recipient = next(kp)
+        last_ref = TransactionReference(hash="a" * 64, ordinal=0)
+
+        txns = create_currency_transaction_batch(
+            [
+                TransferParams(destination=recipient.address, amount=10),
+                TransferParams(destination=recipient.address, amount=20),
+            ],
+            key_pair.private_key,
+            last_ref,
+        )
+
+        batch_hashes = hash_currency_transaction_batch(txns)
+
+        assert [h.value for h in batch_hashes] == [
+            hash_currency_transaction(tx).value for tx in txns
+        ]
+
+    def test_get_transaction_reference_creates_correct_reference(self, kp):
         """Test creating transaction reference."""
-        key_pair = generate_key_pair()
-        key_pair2 = generate_key_pair()
+        key_pair = next(kp)
+        key_pair2 = next(kp)
         last_ref = TransactionReference(hash="a" * 64, ordinal=0)
 
         tx = create_currency_transaction(
@@ -272,10 +302,10 @@ class TestTransactionHashing:
         assert ref.ordinal == 1
         assert len(ref.hash) == 64
 
-    def test_encode_currency_transaction_returns_string(self):
+    def test_encode_currency_transaction_returns_string(self, kp):
         """Test encoding transaction."""
-        key_pair = generate_key_pair()
-        key_pair2 = generate_key_pair()
+        key_pair = next(kp)
+        key_pair2 = next(kp)
         last_ref = TransactionReference(hash="a" * 64, ordinal=0)
 
         tx = create_currency_transaction(
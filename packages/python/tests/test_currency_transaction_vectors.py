@@ -4,16 +4,25 @@ Currency transaction test vector validation
 Validates Python implementation against reference test vectors from tessellation
 """
 
-import json
 from pathlib import Path
+from types import SimpleNamespace
 
-from ecdsa import SECP256k1, SigningKey
+try:
+    # Optional C parser (speed extra); byte-level load skips a str decode
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    import json
+
+    _loads = json.loads
 
 from constellation_sdk.currency_transaction import (
     create_currency_transaction,
     encode_currency_transaction,
     hash_currency_transaction,
     verify_currency_transaction,
+    verify_currency_transactions_bulk,
 )
 from constellation_sdk.currency_types import (
     CurrencyTransactionValue,
@@ -21,14 +30,24 @@ from constellation_sdk.currency_types import (
     TransferParams,
 )
 from constellation_sdk.types import SignatureProof, Signed
-from constellation_sdk.wallet import get_address
+from constellation_sdk.wallet import get_address, get_public_key_hex
 
 # Load test vectors
 VECTORS_PATH = (
     Path(__file__).parent.parent.parent.parent / "shared" / "currency_transaction_vectors.json"
 )
-with open(VECTORS_PATH) as f:
-    test_vectors = json.load(f)
+
+
+def _to_ns(obj):
+    """Recursively convert parsed JSON dicts to attribute-access namespaces."""
+    if isinstance(obj, dict):
+        return SimpleNamespace(**{key: _to_ns(value) for key, value in obj.items()})
+    if isinstance(obj, list):
+        return [_to_ns(value) for value in obj]
+    return obj
+
+
+test_vectors = _to_ns(_loads(VECTORS_PATH.read_bytes()))
 
 
 class TestKeyDerivation:
@@ -36,20 +55,16 @@ class TestKeyDerivation:
 
     def test_public_key_derivation(self):
         """Derives correct public key from private key"""
-        basic = test_vectors["testVectors"]["basicTransaction"]
-        sk = SigningKey.from_string(bytes.fromhex(basic["privateKeyHex"]), curve=SECP256k1)
-        vk = sk.verifying_key
-        public_key = "04" + vk.to_string().hex()
-        assert public_key == basic["publicKeyHex"]
+        basic = test_vectors.testVectors.basicTransaction
+        public_key = get_public_key_hex(basic.privateKeyHex)
+        assert public_key == basic.publicKeyHex
 
     def test_address_derivation(self):
         """Derives correct address from public key"""
-        basic = test_vectors["testVectors"]["basicTransaction"]
-        sk = SigningKey.from_string(bytes.fromhex(basic["privateKeyHex"]), curve=SECP256k1)
-        vk = sk.verifying_key
-        public_key = "04" + vk.to_string().hex()
+        basic = test_vectors.testVectors.basicTransaction
+        public_key = get_public_key_hex(basic.privateKeyHex)
         address = get_address(public_key)
-        assert address == basic["address"]
+        assert address == basic.address
 
 
 class TestTransactionEncoding:
@@ -57,44 +72,44 @@ class TestTransactionEncoding:
 
     def test_encoding_format(self):
         """Encodes transaction correctly"""
-        basic = test_vectors["testVectors"]["basicTransaction"]
+        basic = test_vectors.testVectors.basicTransaction
 
         # Create transaction with known values
         tx = create_currency_transaction(
             TransferParams(
-                destination=basic["transaction"]["destination"],
-                amount=basic["transaction"]["amount"] / 1e8,
-                fee=basic["transaction"]["fee"] / 1e8,
+                destination=basic.transaction.destination,
+                amount=basic.transaction.amount / 1e8,
+                fee=basic.transaction.fee / 1e8,
             ),
-            basic["privateKeyHex"],
+            basic.privateKeyHex,
             TransactionReference(
-                hash=basic["transaction"]["parent"]["hash"],
-                ordinal=basic["transaction"]["parent"]["ordinal"],
+                hash=basic.transaction.parent.hash,
+                ordinal=basic.transaction.parent.ordinal,
             ),
         )
 
         # Override salt for deterministic test
-        tx.value.salt = str(basic["transaction"]["salt"])
+        tx.value.salt = str(basic.transaction.salt)
         tx.proofs = []  # Clear proofs for encoding test
 
         encoded = encode_currency_transaction(tx)
-        assert encoded == basic["encodedString"]
+        assert encoded == basic.encodedString
 
     def test_encoding_breakdown(self):
         """Validates encoding format breakdown"""
-        breakdown = test_vectors["testVectors"]["encodingBreakdown"]
-        components = breakdown["components"]
+        breakdown = test_vectors.testVectors.encodingBreakdown
+        components = breakdown.components
 
         # Verify version prefix
-        assert components["versionPrefix"] == "2"
+        assert components.versionPrefix == "2"
 
         # Verify components are present in full encoding
-        full_encoded = breakdown["fullEncoded"]
+        full_encoded = breakdown.fullEncoded
         assert full_encoded.startswith("2")
-        assert components["source"]["value"] in full_encoded
-        assert components["destination"]["value"] in full_encoded
-        assert components["amountHex"]["value"] in full_encoded
-        assert components["parentHash"]["value"] in full_encoded
+        assert components.source.value in full_encoded
+        assert components.destination.value in full_encoded
+        assert components.amountHex.value in full_encoded
+        assert components.parentHash.value in full_encoded
 
 
 class TestTransactionHashing:
@@ -102,28 +117,28 @@ class TestTransactionHashing:
 
     def test_transaction_hash(self):
         """Produces correct transaction hash"""
-        basic = test_vectors["testVectors"]["basicTransaction"]
+        basic = test_vectors.testVectors.basicTransaction
 
         # Create transaction with deterministic values
         tx = create_currency_transaction(
             TransferParams(
-                destination=basic["transaction"]["destination"],
-                amount=basic["transaction"]["amount"] / 1e8,
-                fee=basic["transaction"]["fee"] / 1e8,
+                destination=basic.transaction.destination,
+                amount=basic.transaction.amount / 1e8,
+                fee=basic.transaction.fee / 1e8,
             ),
-            basic["privateKeyHex"],
+            basic.privateKeyHex,
             TransactionReference(
-                hash=basic["transaction"]["parent"]["hash"],
-                ordinal=basic["transaction"]["parent"]["ordinal"],
+                hash=basic.transaction.parent.hash,
+                ordinal=basic.transaction.parent.ordinal,
             ),
         )
 
         # Override salt for exact match
-        tx.value.salt = str(basic["transaction"]["salt"])
+        tx.value.salt = str(basic.transaction.salt)
         tx.proofs = []
 
         hash_result = hash_currency_transaction(tx)
-        assert hash_result.value == basic["transactionHash"]
+        assert hash_result.value == basic.transactionHash
 
 
 class TestSignatureVerification:
@@ -131,27 +146,25 @@ class TestSignatureVerification:
 
     def test_reference_signature(self):
         """Verifies reference signature"""
-        basic = test_vectors["testVectors"]["basicTransaction"]
+        basic = test_vectors.testVectors.basicTransaction
 
         # Reconstruct transaction from test vector
-        tx_data = basic["transaction"]
+        tx_data = basic.transaction
         tx_value = CurrencyTransactionValue(
-            source=tx_data["source"],
-            destination=tx_data["destination"],
-            amount=tx_data["amount"],
-            fee=tx_data["fee"],
-            parent=TransactionReference(
-                hash=tx_data["parent"]["hash"], ordinal=tx_data["parent"]["ordinal"]
-            ),
-            salt=str(tx_data["salt"]),
+            source=tx_data.source,
+            destination=tx_data.destination,
+            amount=tx_data.amount,
+            fee=tx_data.fee,
+            parent=TransactionReference(hash=tx_data.parent.hash, ordinal=tx_data.parent.ordinal),
+            salt=str(tx_data.salt),
         )
 
         tx = Signed(
             value=tx_value,
             proofs=[
                 SignatureProof(
-                    id=basic["signerId"],
-                    signature=basic["signature"],
+                    id=basic.signerId,
+                    signature=basic.signature,
                 )
             ],
         )
@@ -161,28 +174,56 @@ class TestSignatureVerification:
         assert len(result.valid_proofs) == 1
         assert len(result.invalid_proofs) == 0
 
+    def test_reference_signature_compact_form(self):
+        """Verifies the reference signature converted to compact r||s form"""
+        from ecdsa import SECP256k1
+        from ecdsa.util import sigdecode_der, sigencode_string
+
+        basic = test_vectors.testVectors.basicTransaction
+
+        # Re-encode the DER reference signature as 64-byte compact r||s
+        order = SECP256k1.order
+        r, s = sigdecode_der(bytes.fromhex(basic.signature), order)
+        compact_signature = sigencode_string(r, s, order).hex()
+
+        tx_data = basic.transaction
+        tx = Signed(
+            value=CurrencyTransactionValue(
+                source=tx_data.source,
+                destination=tx_data.destination,
+                amount=tx_data.amount,
+                fee=tx_data.fee,
+                parent=TransactionReference(
+                    hash=tx_data.parent.hash, ordinal=tx_data.parent.ordinal
+                ),
+                salt=str(tx_data.salt),
+            ),
+            proofs=[SignatureProof(id=basic.signerId, signature=compact_signature)],
+        )
+
+        result = verify_currency_transaction(tx)
+        assert result.is_valid is True
+        assert len(result.valid_proofs) == 1
+
     def test_multi_signature(self):
         """Verifies multi-signature transaction"""
-        basic = test_vectors["testVectors"]["basicTransaction"]
-        multi_sig = test_vectors["testVectors"]["multiSignature"]
+        basic = test_vectors.testVectors.basicTransaction
+        multi_sig = test_vectors.testVectors.multiSignature
 
         # Reconstruct transaction with multiple proofs
-        tx_data = basic["transaction"]
+        tx_data = basic.transaction
         tx_value = CurrencyTransactionValue(
-            source=tx_data["source"],
-            destination=tx_data["destination"],
-            amount=tx_data["amount"],
-            fee=tx_data["fee"],
-            parent=TransactionReference(
-                hash=tx_data["parent"]["hash"], ordinal=tx_data["parent"]["ordinal"]
-            ),
-            salt=str(tx_data["salt"]),
+            source=tx_data.source,
+            destination=tx_data.destination,
+            amount=tx_data.amount,
+            fee=tx_data.fee,
+            parent=TransactionReference(hash=tx_data.parent.hash, ordinal=tx_data.parent.ordinal),
+            salt=str(tx_data.salt),
         )
 
         # Convert dict proofs to SignatureProof objects
         proofs = [
-            SignatureProof(id=proof["id"], signature=proof["signature"])
-            for proof in multi_sig["proofs"]
+            SignatureProof(id=proof.id, signature=proof.signature) for proof in multi_sig.proofs
         ]
 
         tx = Signed(
@@ -195,9 +236,15 @@ class TestSignatureVerification:
         assert len(result.valid_proofs) == 2
         assert len(result.invalid_proofs) == 0
 
+        # The pooled bulk path must agree with the single-transaction path
+        (bulk_result,) = verify_currency_transactions_bulk([tx])
+        assert bulk_result.is_valid is result.is_valid
+        assert bulk_result.valid_proofs == result.valid_proofs
+        assert bulk_result.invalid_proofs == result.invalid_proofs
+
         # Verify both proofs are marked as valid in test vectors
-        for proof in multi_sig["proofs"]:
-            assert proof["valid"] is True
+        for proof in multi_sig.proofs:
+            assert proof.valid is True
 
 
 class TestTransactionChaining:
@@ -205,22 +252,22 @@ class TestTransactionChaining:
 
     def test_chain_parent_references(self):
         """Validates transaction chain parent references"""
-        chain = test_vectors["testVectors"]["transactionChaining"]["transactions"]
+        chain = test_vectors.testVectors.transactionChaining.transactions
 
         # Verify first transaction parent
-        assert chain[0]["parentHash"] == "a" * 64
-        assert chain[0]["parentOrdinal"] == 5
-        assert chain[0]["ordinal"] == 6
+        assert chain[0].parentHash == "a" * 64
+        assert chain[0].parentOrdinal == 5
+        assert chain[0].ordinal == 6
 
         # Verify second transaction chains to first
-        assert chain[1]["parentHash"] == chain[0]["hash"]
-        assert chain[1]["parentOrdinal"] == chain[0]["ordinal"]
-        assert chain[1]["ordinal"] == 7
+        assert chain[1].parentHash == chain[0].hash
+        assert chain[1].parentOrdinal == chain[0].ordinal
+        assert chain[1].ordinal == 7
 
         # Verify third transaction chains to second
-        assert chain[2]["parentHash"] == chain[1]["hash"]
-        assert chain[2]["parentOrdinal"] == chain[1]["ordinal"]
-        assert chain[2]["ordinal"] == 8
+        assert chain[2].parentHash == chain[1].hash
+        assert chain[2].parentOrdinal == chain[1].ordinal
+        assert chain[2].ordinal == 8
 
 
 class TestEdgeCases:
@@ -228,25 +275,25 @@ class TestEdgeCases:
 
     def test_minimum_amount(self):
         """Validates minimum amount transaction"""
-        min_amount = test_vectors["testVectors"]["edgeCases"]["minAmount"]
-        assert min_amount["amount"] == 1
-        assert min_amount["hash"]
-        assert min_amount["signature"]
+        min_amount = test_vectors.testVectors.edgeCases.minAmount
+        assert min_amount.amount == 1
+        assert min_amount.hash
+        assert min_amount.signature
 
     def test_maximum_amount(self):
         """Validates maximum amount transaction"""
-        max_amount = test_vectors["testVectors"]["edgeCases"]["maxAmount"]
-        assert max_amount["amount"] == 9223372036854775807
-        assert max_amount["hash"]
-        assert max_amount["signature"]
+        max_amount = test_vectors.testVectors.edgeCases.maxAmount
+        assert max_amount.amount == 9223372036854775807
+        assert max_amount.hash
+        assert max_amount.signature
 
     def test_non_zero_fee(self):
         """Validates transaction with non-zero fee"""
-        with_fee = test_vectors["testVectors"]["edgeCases"]["withFee"]
-        assert with_fee["amount"] == 10000000000
-        assert with_fee["fee"] == 100000
-        assert with_fee["hash"]
-        assert with_fee["signature"]
+        with_fee = test_vectors.testVectors.edgeCases.withFee
+        assert with_fee.amount == 10000000000
+        assert with_fee.fee == 100000
+        assert with_fee.hash
+        assert with_fee.signature
 
 
 class TestKryoSerialization:
@@ -254,13 +301,19 @@ class TestKryoSerialization:
 
     def test_set_references_flag(self):
         """Validates Kryo setReferences=false format (v2 transactions)"""
-        params = test_vectors["cryptoParams"]
-        assert params["kryoSetReferences"] is False
+        params = test_vectors.cryptoParams
+        assert params.kryoSetReferences is False
 
     def test_kryo_header(self):
         """Validates Kryo header without reference flag (v2 format)"""
-        basic = test_vectors["testVectors"]["basicTransaction"]
-        kryo_hex = basic["kryoBytesHex"]
+        from constellation_sdk.currency_transaction import _validate_v2_kryo_header
+
+        basic = test_vectors.testVectors.basicTransaction
+        kryo_hex = basic.kryoBytesHex
         # Should start with 0x03 (string type) followed by length, no 0x01 reference flag for v2
         assert kryo_hex.startswith("03")
         assert not kryo_hex.startswith("0301")  # No reference flag for v2
+
+        # The SDK's byte-level validator must agree with the hex checks
+        assert _validate_v2_kryo_header(bytes.fromhex(kryo_hex)) is True
+        assert _validate_v2_kryo_header(b"\x03\x01") is False
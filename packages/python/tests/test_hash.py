@@ -1,6 +1,14 @@
 """Tests for hashing utilities."""
 
-from constellation_sdk import compute_digest, hash_bytes, hash_data
+import hashlib
+
+from constellation_sdk import (
+    compute_digest,
+    hash_bytes,
+    hash_data,
+    hash_data_streaming,
+    hash_many,
+)
 
 
 class TestHashData:
@@ -49,6 +57,36 @@ class TestHashBytes:
         assert result1.value == result2.value
 
 
+class TestHashDataStreaming:
+    """Test hash_data_streaming function."""
+
+    def test_matches_hash_data(self):
+        """Streaming hash should equal the buffered hash."""
+        data = {"items": [{"id": i, "payload": "x" * 100} for i in range(50)]}
+        assert hash_data_streaming(data).value == hash_data(data).value
+
+    def test_matches_hash_data_for_data_update(self):
+        """Streaming hash should equal the buffered hash for DataUpdates."""
+        data = {"items": [{"id": i, "payload": "x" * 100} for i in range(50)]}
+        streamed = hash_data_streaming(data, is_data_update=True)
+        buffered = hash_data(data, is_data_update=True)
+        assert streamed.value == buffered.value
+
+
+class TestHashMany:
+    """Test hash_many function."""
+
+    def test_matches_single_shot_sha512(self):
+        """Batch digests should match per-message hashlib.sha512."""
+        bufs = [b"hello", b"world", b""]
+        results = hash_many(bufs)
+        assert results == [hashlib.sha512(buf).digest() for buf in bufs]
+
+    def test_empty_batch(self):
+        """Empty input should produce empty output."""
+        assert hash_many([]) == []
+
+
 class TestComputeDigest:
     """Test compute_digest function."""
 
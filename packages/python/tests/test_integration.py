@@ -3,16 +3,22 @@
 import pytest
 
 from constellation_sdk import (
+    SignatureProof,
     add_signature,
     batch_sign,
     create_signed_object,
     generate_key_pair,
+    get_public_key_id,
+    hash_data,
     is_valid_private_key,
     is_valid_public_key,
     key_pair_from_private_key,
     sign,
     sign_data_update,
+    sign_hash,
     verify,
+    verify_batch,
+    verify_many_proofs,
     verify_signature,
 )
 
@@ -32,6 +38,15 @@ class TestKeyGeneration:
         assert is_valid_public_key(key_pair.public_key)
         assert key_pair.address.startswith("DAG")
 
+    def test_rejects_whitespace_in_keys(self):
+        """Keys padded with whitespace should be rejected."""
+        # bytes.fromhex skips ASCII whitespace, so the validators must
+        # catch it explicitly
+        assert not is_valid_private_key("ab" * 31 + "  ")
+        assert not is_valid_private_key("ab" * 31 + "\t\t")
+        assert not is_valid_public_key("ab" * 63 + "\n\n")
+        assert not is_valid_public_key("04" + "ab" * 63 + "\r\r")
+
     def test_derives_same_key_pair(self):
         """Same private key should derive same key pair."""
         key_pair1 = generate_key_pair()
@@ -45,9 +60,9 @@ class TestRegularSigning:
     """Test regular (non-DataUpdate) signing."""
 
     @pytest.fixture
-    def key_pair(self):
-        """Generate a key pair for tests."""
-        return generate_key_pair()
+    def key_pair(self, key_pool):
+        """A key pair from the shared pool."""
+        return key_pool[0]
 
     def test_sign_and_verify(self, key_pair):
         """Should sign and verify data."""
@@ -79,9 +94,9 @@ class TestDataUpdateSigning:
     """Test DataUpdate signing."""
 
     @pytest.fixture
-    def key_pair(self):
-        """Generate a key pair for tests."""
-        return generate_key_pair()
+    def key_pair(self, key_pool):
+        """A key pair from the shared pool."""
+        return key_pool[0]
 
     def test_sign_and_verify_data_update(self, key_pair):
         """Should sign and verify DataUpdate."""
@@ -109,10 +124,10 @@ class TestDataUpdateSigning:
 class TestMultiSignature:
     """Test multi-signature functionality."""
 
-    def test_add_signature(self):
+    def test_add_signature(self, kp):
         """Should add signature to existing signed object."""
-        key_pair1 = generate_key_pair()
-        key_pair2 = generate_key_pair()
+        key_pair1 = next(kp)
+        key_pair2 = next(kp)
         data = {"action": "multi-sig", "value": "test"}
 
         # First signature
@@ -128,11 +143,11 @@ class TestMultiSignature:
         assert result.is_valid
         assert len(result.valid_proofs) == 2
 
-    def test_batch_sign(self):
+    def test_batch_sign(self, kp):
         """Should batch sign with multiple keys."""
-        key_pair1 = generate_key_pair()
-        key_pair2 = generate_key_pair()
-        key_pair3 = generate_key_pair()
+        key_pair1 = next(kp)
+        key_pair2 = next(kp)
+        key_pair3 = next(kp)
         data = {"action": "batch", "value": "test"}
 
         signed = batch_sign(
@@ -147,13 +162,136 @@ class TestMultiSignature:
         assert len(result.valid_proofs) == 3
 
 
+class TestBatchVerification:
+    """Test the batch verification entry points."""
+
+    def test_verify_batch_matches_scalar(self, key_pool):
+        """Batch results should agree with per-object verify()."""
+        from constellation_sdk.types import Signed
+
+        keys = [pair.private_key for pair in key_pool[:3]]
+
+        valid_single = create_signed_object({"value": 1}, keys[0])
+        valid_multi = batch_sign({"value": 2}, keys)
+        tampered = Signed(value={"value": 999}, proofs=list(valid_single.proofs))
+
+        # Six proofs total, crossing the threaded threshold
+        objects = [valid_single, valid_multi, tampered, create_signed_object({"value": 3}, keys[1])]
+
+        results = verify_batch(objects)
+
+        assert len(results) == len(objects)
+        for signed, batch_result in zip(objects, results):
+            single_result = verify(signed)
+            assert batch_result.is_valid is single_result.is_valid
+            assert batch_result.valid_proofs == single_result.valid_proofs
+            assert batch_result.invalid_proofs == single_result.invalid_proofs
+
+        assert results[0].is_valid
+        assert results[1].is_valid
+        assert not results[2].is_valid
+
+    def test_verify_many_proofs_all_valid(self, key_pool):
+        """All proofs over one hash should verify, above the pool threshold."""
+        hash_hex = hash_data({"action": "many"}).value
+
+        proofs = [
+            SignatureProof(
+                id=get_public_key_id(pair.private_key),
+                signature=sign_hash(hash_hex, pair.private_key),
+            )
+            for pair in key_pool[:5]
+        ]
+
+        result = verify_many_proofs(hash_hex, proofs)
+        assert result.is_valid
+        assert len(result.valid_proofs) == 5
+        assert len(result.invalid_proofs) == 0
+
+    def test_verify_many_proofs_mixed(self, key_pool):
+        """A proof signed by a different key should land in invalid_proofs."""
+        hash_hex = hash_data({"action": "mixed"}).value
+
+        proofs = [
+            SignatureProof(
+                id=get_public_key_id(pair.private_key),
+                signature=sign_hash(hash_hex, pair.private_key),
+            )
+            for pair in key_pool[:4]
+        ]
+        # Valid signature, wrong signer id
+        mismatched = SignatureProof(id=proofs[0].id, signature=proofs[1].signature)
+
+        result = verify_many_proofs(hash_hex, [*proofs, mismatched])
+        assert not result.is_valid
+        assert result.valid_proofs == proofs
+        assert result.invalid_proofs == [mismatched]
+
+    def test_verify_many_proofs_below_pool_threshold(self, key_pool):
+        """The sequential path (< 4 proofs) should behave identically."""
+        hash_hex = hash_data({"action": "few"}).value
+
+        proofs = [
+            SignatureProof(
+                id=get_public_key_id(pair.private_key),
+                signature=sign_hash(hash_hex, pair.private_key),
+            )
+            for pair in key_pool[:2]
+        ]
+
+        result = verify_many_proofs(hash_hex, proofs)
+        assert result.is_valid
+        assert len(result.valid_proofs) == 2
+
+
+class TestValidatorRegistry:
+    """Test registry-backed verification."""
+
+    def test_registry_matches_registry_free_verify(self, key_pool):
+        """Registry-backed verify() should agree with the default path."""
+        from constellation_sdk import ValidatorRegistry
+
+        keys = [pair.private_key for pair in key_pool[:3]]
+        signed = batch_sign({"action": "registry"}, keys)
+
+        registry = ValidatorRegistry()
+        baseline = verify(signed)
+        result = verify(signed, registry=registry)
+
+        assert result.is_valid is baseline.is_valid
+        assert result.valid_proofs == baseline.valid_proofs
+        assert result.invalid_proofs == baseline.invalid_proofs
+
+        # Keys are pinned after the first pass and reused on the second
+        assert len(registry._keys) == 3
+        repeat = verify(signed, registry=registry)
+        assert repeat.is_valid
+        assert len(registry._keys) == 3
+
+    def test_registry_marks_unparseable_key_invalid(self, key_pool):
+        """A proof whose id cannot be parsed should be invalid, not raise."""
+        from constellation_sdk import ValidatorRegistry
+        from constellation_sdk.types import Signed
+
+        data = {"action": "registry-bad-key"}
+        signed = create_signed_object(data, key_pool[0].private_key)
+        bad_proof = SignatureProof(id="zz" * 64, signature=signed.proofs[0].signature)
+        mixed = Signed(value=data, proofs=[*signed.proofs, bad_proof])
+
+        result = verify(mixed, registry=ValidatorRegistry())
+
+        assert not result.is_valid
+        assert result.valid_proofs == signed.proofs
+        assert result.invalid_proofs == [bad_proof]
+
+
 class TestTamperDetection:
     """Test tamper detection."""
 
     @pytest.fixture
-    def key_pair(self):
-        """Generate a key pair for tests."""
-        return generate_key_pair()
+    def key_pair(self, key_pool):
+        """A key pair from the shared pool."""
+        return key_pool[0]
 
     def test_detects_modified_data(self, key_pair):
         """Should detect modified data."""